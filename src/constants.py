@@ -78,6 +78,23 @@ TERMINAL_GREEN = (0, 255, 0)
 TERMINAL_DIM_GREEN = (0, 180, 0)
 BG_COLOR = (10, 20, 10)
 
+# Audio settings (sounds are decoded to this format once, at load)
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512  # Small buffer for low sound effect latency
+
+# Mixer channels. The game's sound effects each own one of the first SFX_RESERVED_CHANNELS,
+# which are reserved so BGM and menu sounds never land on them; the pool is raised from
+# pygame's default 8 so those still have channels to spare
+MIXER_NUM_CHANNELS = 16
+SFX_CHANNEL_CLICK = 0
+SFX_CHANNEL_INTERACT = 1
+SFX_CHANNEL_NPC = 2
+SFX_CHANNEL_SUCCESS = 3
+SFX_CHANNEL_INVALID = 4
+SFX_RESERVED_CHANNELS = 5
+
 # Font settings
 FONT_PATH = "assets/fonts/PixelSerif.ttf"
 TERMINAL_FONT_SIZE = 24
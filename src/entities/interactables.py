@@ -12,12 +12,18 @@ from rules import game_state
 class Interactable:
     """Base class for interactable objects"""
     
+    # Whether this interactable spans several tiles; lets hot loops branch without hasattr
+    is_multi_tile = False
+    
     def __init__(self, x: int, y: int, tile_id: str):
         self.x = x
         self.y = y
         self.tile_id = tile_id
         self.rect = pygame.Rect(x * 16, y * 16, 16, 16)
         
+        # Every tile this interactable covers, so single and multi-tile objects iterate the same way
+        self.tile_positions: Tuple[Tuple[int, int], ...] = ((x, y),)
+        
     def interact(self, player_x: int, player_y: int) -> Dict[str, Any]:
         """Handle interaction with this object"""
         return {"type": "none"}
@@ -76,12 +82,15 @@ class EmptyInteractable(Interactable):
 class MultiTileInteractable(Interactable):
     """An interactable that spans multiple tiles"""
     
+    is_multi_tile = True
+    
     def __init__(self, tiles: Set[Tuple[int, int]], tile_id: str, interaction_type: str = "note"):
         # Use the first tile as the primary position
         first_tile = next(iter(tiles))
         super().__init__(first_tile[0], first_tile[1], tile_id)
         
         self.tiles = tiles
+        self.tile_positions = tuple(tiles)
         self.interaction_type = interaction_type
         
         # Calculate bounding box for all tiles
@@ -979,6 +988,8 @@ class InteractableManager:
         if not tiles:
             return []
         
+        # The only copy of the caller's set; tiles leave it as soon as they are queued,
+        # so each tile is processed exactly once
         remaining_tiles = tiles.copy()
         groups = []
         
@@ -989,24 +1000,26 @@ class InteractableManager:
             
             while to_process:
                 current_tile = to_process.pop()
-                if current_tile in current_group:
-                    continue
-                
                 current_group.add(current_tile)
                 x, y = current_tile
                 
-                # Check all 4 adjacent positions (not diagonal)
-                adjacent_positions = [
-                    (x - 1, y),  # Left
-                    (x + 1, y),  # Right
-                    (x, y - 1),  # Up
-                    (x, y + 1),  # Down
-                ]
-                
-                for adj_pos in adjacent_positions:
-                    if adj_pos in remaining_tiles:
-                        to_process.append(adj_pos)
-                        remaining_tiles.remove(adj_pos)
+                # Check all 4 adjacent positions (not diagonal), unrolled to skip building a list per tile
+                adj_pos = (x - 1, y)  # Left
+                if adj_pos in remaining_tiles:
+                    to_process.append(adj_pos)
+                    remaining_tiles.remove(adj_pos)
+                adj_pos = (x + 1, y)  # Right
+                if adj_pos in remaining_tiles:
+                    to_process.append(adj_pos)
+                    remaining_tiles.remove(adj_pos)
+                adj_pos = (x, y - 1)  # Up
+                if adj_pos in remaining_tiles:
+                    to_process.append(adj_pos)
+                    remaining_tiles.remove(adj_pos)
+                adj_pos = (x, y + 1)  # Down
+                if adj_pos in remaining_tiles:
+                    to_process.append(adj_pos)
+                    remaining_tiles.remove(adj_pos)
             
             groups.append(current_group)
         
@@ -1,5 +1,6 @@
 import pygame
 import os
+import math
 from typing import Dict, List, Optional, Tuple, Any
 from .loader import LevelLoader, Level
 
@@ -259,6 +260,13 @@ class LayeredLevelManager:
         # Performance settings
         self.cull_offscreen_sprites = True
         self.sprite_culling_margin = 64  # Extra pixels around screen to keep sprites active
+        self.cache_static_layer = True  # Draw all tiles from one pre-rendered surface
+        
+        # Every tile pre-rendered at 1x, the world rect it covers and the scaled-view buffer;
+        # rebuilt on first render after the tile sprites change
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_layer_rect: Optional[pygame.Rect] = None
+        self._scaled_view: Optional[pygame.Surface] = None
         
         self.refresh_level_list()
     
@@ -305,6 +313,7 @@ class LayeredLevelManager:
     
     def _create_tile_sprites(self):
         """Create TileSprite objects for all tiles in all layers"""
+        self._static_layer = None
         if not self.current_level:
             return
         
@@ -408,11 +417,84 @@ class LayeredLevelManager:
                 sprite.update_screen_position(camera_x, camera_y, zoom)
                 self.visible_sprites.add(sprite)
     
+    def _build_static_layer(self):
+        """Pre-render every tile sprite, in layer order, onto one opaque surface at 1x"""
+        # Sprites drawn by the per-sprite path hold a zoomed image; the unscaled one is kept aside
+        sprites = self.tile_sprites.sprites()  # LayeredUpdates keeps these in layer order
+        if sprites:
+            bounds = sprites[0]._original_rect.unionall([s._original_rect for s in sprites])
+        else:
+            bounds = pygame.Rect(0, 0, 1, 1)
+        
+        # The screen is cleared to black before the level is drawn, so black stands in for empty space
+        layer = pygame.Surface(bounds.size).convert()
+        layer.fill((0, 0, 0))
+        layer.blits(
+            [(getattr(s, '_original_image', s.image), (s._original_rect.x - bounds.x, s._original_rect.y - bounds.y))
+             for s in sprites],
+            doreturn=False
+        )
+        
+        self._static_layer = layer
+        self._static_layer_rect = bounds
+        self._tile_rects = [s._original_rect for s in sprites]
+    
+    def _render_static_layer(self):
+        """Draw the part of the pre-rendered level the camera sees, scaled by the zoom"""
+        if self._static_layer is None:
+            self._build_static_layer()
+        
+        zoom = self.camera.zoom
+        camera_x, camera_y = int(self.camera.x), int(self.camera.y)
+        
+        # World area under the screen, clipped to the pre-rendered level
+        screen_width, screen_height = self.screen.get_size()
+        view = pygame.Rect(
+            camera_x, camera_y,
+            math.ceil(screen_width / zoom) + 1, math.ceil(screen_height / zoom) + 1
+        ).clip(self._static_layer_rect)
+        if not view.w or not view.h:
+            return
+        
+        area = self._static_layer.subsurface(view.move(-self._static_layer_rect.x, -self._static_layer_rect.y))
+        size = (int(view.w * zoom), int(view.h * zoom))
+        dest = (int((view.x - camera_x) * zoom), int((view.y - camera_y) * zoom))
+        
+        if zoom == 1.0:
+            self.screen.blit(area, dest)
+            return
+        
+        # Scale into a reused buffer instead of allocating a screen-sized surface every frame
+        if self._scaled_view is None or self._scaled_view.get_size() != size:
+            self._scaled_view = pygame.Surface(size).convert()
+        pygame.transform.scale(area, size, self._scaled_view)
+        self.screen.blit(self._scaled_view, dest)
+    
+    def _count_visible_tiles(self) -> int:
+        """Count tiles within the camera view plus the culling margin"""
+        if not self.cache_static_layer:
+            return len(self.visible_sprites)
+        if self._static_layer is None:
+            return 0
+        visible_rect = self.camera.get_visible_rect().inflate(
+            2 * self.sprite_culling_margin, 2 * self.sprite_culling_margin
+        )
+        return len(visible_rect.collidelistall(self._tile_rects))
+    
     def render_level(self, debug_info: bool = False):
         """Render the current level using layered sprites"""
         if not self.current_level:
             return
         
+        if self.cache_static_layer:
+            # Tiles never change between loads, so draw them all from the pre-rendered layer
+            self._render_static_layer()
+            
+            # Debug information
+            if debug_info:
+                self._render_debug_info()
+            return
+        
         # Update sprites first
         self.update()
         
@@ -448,7 +530,7 @@ class LayeredLevelManager:
         debug_texts = [
             f"Level: {self.current_level_name}",
             f"Total Sprites: {len(self.tile_sprites)}",
-            f"Visible Sprites: {len(self.visible_sprites)}",
+            f"Visible Sprites: {self._count_visible_tiles()}",
             f"Camera: ({int(self.camera.x)}, {int(self.camera.y)})",
             f"Zoom: {self.camera.zoom:.2f}x",
             f"Layers: {len(self.current_level.layers)}"
@@ -498,7 +580,7 @@ class LayeredLevelManager:
             'layers': list(self.current_level.layers.keys()),
             'collision_layers': [layer.name for layer in self.current_level.get_collision_layers()],
             'total_sprites': len(self.tile_sprites),
-            'visible_sprites': len(self.visible_sprites)
+            'visible_sprites': self._count_visible_tiles()
         }
     
     def set_layer_depths(self, depth_mapping: Dict[str, int]):
@@ -510,6 +592,7 @@ class LayeredLevelManager:
     
     def toggle_layer_visibility(self, layer_name: str, visible: bool):
         """Show or hide a specific layer"""
+        self._static_layer = None
         layer_depth = self.renderer.get_layer_depth(layer_name)
         
         if visible:
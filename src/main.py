@@ -2,9 +2,14 @@ import os
 import sys
 import pygame
 from pygame.locals import DOUBLEBUF
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH,
+    MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER,
+    MIXER_NUM_CHANNELS, SFX_RESERVED_CHANNELS
+)
 
 from states.menu_state import Menu
+from states.menu_substates.ui.font_cache import get_font
 from states.game_state import GameDemo
 from states.prelude_state import PreludeState
 from states.end_state import EndState
@@ -12,13 +17,17 @@ from pyvidplayer2 import Video
 
 class Game:
     def __init__(self):
+        # Fix the mixer format before init so every sound is converted to it once, at load
+        pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
         pygame.init()
         pygame.mixer.init()
+        pygame.mixer.set_num_channels(MIXER_NUM_CHANNELS)
+        pygame.mixer.set_reserved(SFX_RESERVED_CHANNELS)  # The game's sound effects own these; keep the BGM off them
         self.is_fullscreen = False
         self.windowed_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Initialize single screen without OpenGL
-        self.screen = pygame.display.set_mode(self.windowed_size, DOUBLEBUF)
+        self.screen = self.set_display_mode(self.windowed_size, DOUBLEBUF)
         pygame.display.set_caption("The Final String")
         
         # Initialize states (don't create GameDemo yet - create when needed)
@@ -44,7 +53,7 @@ class Game:
         self.running = True
         self.vid1 = None  # Initialize video as None - load when needed
         self.vid2 = None  # Initialize video as None - load when needed
-        self.skip_font = pygame.font.Font(FONT_PATH, 24)
+        self.skip_font = get_font(FONT_PATH, 24)
 
     def apply_scanline_effect(self, surface):
         """Apply a simple scanline effect using pure Pygame"""
@@ -64,16 +73,24 @@ class Game:
         self.is_fullscreen = not self.is_fullscreen
         if self.is_fullscreen:
             display_info = pygame.display.Info()
-            self.screen = pygame.display.set_mode(
+            self.screen = self.set_display_mode(
                 (display_info.current_w, display_info.current_h),
                 DOUBLEBUF | pygame.FULLSCREEN
             )
         else:
-            self.screen = pygame.display.set_mode(
+            self.screen = self.set_display_mode(
                 self.windowed_size,
                 DOUBLEBUF
             )
 
+    def set_display_mode(self, size, flags):
+        """Set the display mode, asking for vsync so buffer flips don't tear"""
+        try:
+            return pygame.display.set_mode(size, flags, vsync=1)
+        except pygame.error:
+            # No vsync on this driver; frames are still capped by the main loop's clock
+            return pygame.display.set_mode(size, flags)
+
     def render_frame(self):
         """Handle the complete rendering pipeline"""
         if self.current_state == 'prelude':
@@ -269,7 +286,9 @@ class Game:
                         # For video states, use video timing
                         pygame.time.wait(16)  # ~60 FPS
                     else:
-                        # For other states, use normal clock
+                        # For other states, use normal clock. The menu animations advance per frame,
+                        # so the cap stays even with vsync; a vsynced flip may report vsync without
+                        # actually waiting (software renderer), or run faster than 60 Hz
                         self.clock.tick(60)
             
             # Exit final state
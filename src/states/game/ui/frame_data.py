@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+
+@dataclass(slots=True)
+class FrameData:
+    """Per-frame game state consumed by UIManager.render"""
+    player_speed: float = 0
+    camera_zoom: float = 1.0
+    nearest_door: tuple | None = None
+    door_angle: float = 0
+    current_rules: list[str] = field(default_factory=list)
+    total_rules: int | None = None
+    paused: bool = False
+    player_pos: tuple | None = None
+    mouse_pos: tuple | None = None
+    fps: float | None = None
+    debug_info: dict = field(default_factory=dict)
@@ -1,5 +1,6 @@
 import pygame
 import os
+from ..utils.fast_blits import fast_blits
 
 class HUD:
     """Manages the heads-up display elements"""
@@ -9,6 +10,10 @@ class HUD:
         self.show_speed_debug = False
         self.show_coordinates = False
         self._init_font()
+        
+        # Indicator (outline, text) surfaces keyed by their text; redrawn only when the value changes
+        self._indicator_cache: dict[str, tuple] = {}
+        self._indicator_cache_size = 16
 
     def _init_font(self):
         """Initialize font with fallback"""
@@ -33,32 +38,46 @@ class HUD:
             print(f"Warning: Could not initialize font: {e}")
             self.font = pygame.font.SysFont('arial', 32)
      
-    def draw_speed_indicator(self, speed: float):
-        """Draw the speed indicator"""
+    def _get_indicator_surfaces(self, text: str) -> tuple:
+        """Get the (outline, text) surfaces for an indicator, rendering them only when the text changes"""
+        surfaces = self._indicator_cache.get(text)
+        if surfaces is None:
+            surfaces = (self.font.render(text, True, (0, 0, 0)), self.font.render(text, True, (255, 255, 255)))
+            if len(self._indicator_cache) >= self._indicator_cache_size:
+                self._indicator_cache.pop(next(iter(self._indicator_cache)))  # Drop the oldest entry
+            self._indicator_cache[text] = surfaces
+        return surfaces
+     
+    def speed_indicator_blits(self, speed: float) -> list[tuple]:
+        """Get the (surface, position) pairs that draw the speed indicator"""
         if not self.show_speed_debug:
-            return
+            return []
             
         speed_text = f"Speed: {speed:.1f}"
-        text_surface = self.font.render(speed_text, True, (255, 255, 255))
-        outline_surface = self.font.render(speed_text, True, (0, 0, 0))
+        outline_surface, text_surface = self._get_indicator_surfaces(speed_text)
         
         x_pos = self.screen.get_width() - text_surface.get_width() - 20
         y_pos = 20
         
-        self.screen.blit(outline_surface, (x_pos + 1, y_pos + 1))
-        self.screen.blit(text_surface, (x_pos, y_pos))
+        return [(outline_surface, (x_pos + 1, y_pos + 1)), (text_surface, (x_pos, y_pos))]
         
-    def draw_zoom_indicator(self, zoom: float):
-        """Draw the zoom level indicator"""
+    def zoom_indicator_blits(self, zoom: float) -> list[tuple]:
+        """Get the (surface, position) pairs that draw the zoom level indicator"""
         zoom_text = f"Zoom: {zoom:.1f}x"
-        text_surface = self.font.render(zoom_text, True, (255, 255, 255))
-        outline_surface = self.font.render(zoom_text, True, (0, 0, 0))
+        outline_surface, text_surface = self._get_indicator_surfaces(zoom_text)
         
         x_pos = self.screen.get_width() - text_surface.get_width() - 20
         y_pos = 50 if self.show_speed_debug else 20
         
-        self.screen.blit(outline_surface, (x_pos + 1, y_pos + 1))
-        self.screen.blit(text_surface, (x_pos, y_pos))
+        return [(outline_surface, (x_pos + 1, y_pos + 1)), (text_surface, (x_pos, y_pos))]
+     
+    def draw_speed_indicator(self, speed: float):
+        """Draw the speed indicator"""
+        fast_blits(self.screen, self.speed_indicator_blits(speed))
+        
+    def draw_zoom_indicator(self, zoom: float):
+        """Draw the zoom level indicator"""
+        fast_blits(self.screen, self.zoom_indicator_blits(zoom))
         
     def draw_instructions(self):
         """Draw control instructions"""
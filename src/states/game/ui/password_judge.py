@@ -1,4 +1,5 @@
 import pygame
+import pygame.freetype
 from typing import List, Dict, Optional, Callable
 import os
 from ..utils.wrap_text import wrap_text
@@ -63,6 +64,11 @@ class PasswordUI:
         self.validate_button_hover_color = (100, 150, 200)  # Lighter blue when hovered
         self.validate_button_text_color = (220, 220, 230)  # Light gray text
 
+        # Static panel (background, title, message, labels) rendered once and reused
+        self._panel_cache = None
+        self._panel_cache_key = None
+        self._rules_rect_offset = 0
+
         # Initialize dimensions
         self._init_dimensions()
 
@@ -85,6 +91,13 @@ class PasswordUI:
                 self.label_font = pygame.font.Font(label_font_path, 26)
                 self.title_font = pygame.font.Font(label_font_path, 42) 
                 self.small_font = pygame.font.Font(content_font_path, 16) 
+                
+                # FreeType faces for text drawn straight into existing surfaces via render_to
+                pygame.freetype.init()
+                self.font_ft = self._init_freetype_font(content_font_path, 20)
+                self.label_font_ft = self._init_freetype_font(label_font_path, 26)
+                self.title_font_ft = self._init_freetype_font(label_font_path, 42)
+                self.small_font_ft = self._init_freetype_font(content_font_path, 16)
                 print("Successfully loaded custom fonts")
             else:
                 print(f"Warning: Font file not found at {content_font_path} and {label_font_path}")
@@ -92,6 +105,17 @@ class PasswordUI:
         except (pygame.error, IOError) as e:
             print(f"Warning: Could not initialize PauseButton font: {e}")
             self.font = pygame.font.SysFont('arial', 32)
+
+    def _init_freetype_font(self, font_path: str, size: int) -> pygame.freetype.Font:
+        """Load a FreeType font positioned by its baseline origin, like pygame.font"""
+        font = pygame.freetype.Font(font_path, size)
+        font.origin = True  # render_to dest is the pen origin on the baseline
+        return font
+
+    def _render_text_to(self, surface: pygame.Surface, font: pygame.font.Font, font_ft: pygame.freetype.Font,
+                        pos: tuple, text: str, color: tuple):
+        """Render text directly into surface, using the pygame.font metrics for placement"""
+        font_ft.render_to(surface, (pos[0], pos[1] + font.get_ascent()), text, color)
         
     def show(self, rules: List[str], door, callback: Callable = None, collected_rules: List[str] = None, preserved_password: str = "", close_callback: Callable = None):
         """Show the password UI with given rules"""
@@ -205,8 +229,7 @@ class PasswordUI:
         
         # Handle mouse hover for close button
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            self.close_button_hovered = self.close_button_rect.collidepoint(mouse_pos)
+            self.close_button_hovered = self.close_button_rect.collidepoint(event.pos)
             if self.validate_button_rect:
                 self.validate_button_hovered = self.validate_button_rect.collidepoint(event.pos)
         
@@ -355,6 +378,11 @@ class PasswordUI:
         except Exception as e:
             print(f"Error updating PasswordUI: {e}")
 
+    def update_rules_text(self, delta_time: float):
+        """Advance the rules text animations; does nothing while no rules are shown"""
+        if self.rules_text is not None:
+            self.rules_text.update(delta_time)
+            
     def _init_dimensions(self):
         """Initialize/update UI dimensions based on screen size"""
         # Base dimensions
@@ -414,10 +442,12 @@ class PasswordUI:
         input_label_to_field_offset = 10 # Space between input label and field
         validation_text_y_offset = 10 # Space between input field and validation
         
-        # Draw main UI panel
-        panel_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(self.screen, self.panel_bg_color, panel_rect, border_radius=10) # Added rounded corners
-        pygame.draw.rect(self.screen, self.panel_border_color, panel_rect, 2, border_radius=10)
+        # Draw main UI panel (background, title, message and labels only change with the message or size)
+        panel_cache_key = (self.message, self.width, self.height)
+        if self._panel_cache is None or self._panel_cache_key != panel_cache_key:
+            self._panel_cache = self._build_panel_cache(panel_padding, rules_rect_height, input_field_y_offset)
+            self._panel_cache_key = panel_cache_key
+        self.screen.blit(self._panel_cache, (self.x, self.y))
         
         # Draw close button (X)
         close_button_color = (200, 100, 100) if self.close_button_hovered else (150, 150, 160)
@@ -439,26 +469,9 @@ class PasswordUI:
         pygame.draw.line(self.screen, close_button_color, 
                         (center_x + offset, center_y - offset), 
                         (center_x - offset, center_y + offset), 3)
-        
-        # Draw title
-        title_text = self.title_font.render("The Password Judge", True, self.title_text_color)
-        title_x = self.x + (self.width - title_text.get_width()) // 2
-        self.screen.blit(title_text, (title_x, self.y + panel_padding))
-
-        # Draw message
-        message_text_y = self.y + panel_padding + title_text.get_height() + 5
-        message_text = self.small_font.render(self.message, True, self.message_color)
-        message_x = self.x + (self.width - message_text.get_width()) // 2
-        self.screen.blit(message_text, (message_x, message_text_y))
-
-        # Draw rules title
-        rules_title = self.label_font.render("The Ruleset", True, self.text_color)
-        rules_title_x = self.x + (self.width - rules_title.get_width()) // 2
-        rules_title_y = message_text_y + message_text.get_height() + 20  # Small gap after message
-        self.screen.blit(rules_title, (rules_title_x, rules_title_y))
 
         # Draw rules rectangle
-        rules_rect_y = rules_title_y + rules_title.get_height() + 5  # Small gap after rules title
+        rules_rect_y = self.y + self._rules_rect_offset
         rules_rect = pygame.Rect(self.x + panel_padding, rules_rect_y, self.width - panel_padding*2, rules_rect_height)
 
         # Inside the render method where line colors are set
@@ -488,9 +501,8 @@ class PasswordUI:
         # --- Input Label and Field --- 
         current_y = rules_rect_y + rules_rect_height + input_field_y_offset
 
-        input_label = self.font.render("Type your password on the validator field:", True, self.text_color)
-        self.screen.blit(input_label, (self.x + panel_padding, current_y))
-        current_y += input_label.get_height() + input_label_to_field_offset
+        # Input label is part of the cached panel
+        current_y += self.font.get_height() + input_label_to_field_offset
         
         if self.password_input:
             self.password_input.rect.y = current_y
@@ -515,8 +527,8 @@ class PasswordUI:
             
             validation_text = f"Rules satisfied: {valid_count}/{total_collected} | Total required: {total_collected}/{total_required} | {char_count_text}"
             validation_color = self.satisfied_rule_color if valid_count == total_collected and total_collected >= total_required and total_collected > 0 else self.unsatisfied_rule_color
-            validation_surface = self.small_font.render(validation_text, True, validation_color)
-            self.screen.blit(validation_surface, (self.x + panel_padding, validation_text_y))
+            self._render_text_to(self.screen, self.small_font, self.small_font_ft,
+                                 (self.x + panel_padding, validation_text_y), validation_text, validation_color)
 
         validation_text_height = self.small_font.get_height()
         button_y = validation_text_y + validation_text_height + 15  # Space after validation text
@@ -533,10 +545,40 @@ class PasswordUI:
         pygame.draw.rect(self.screen, (100, 100, 110), self.validate_button_rect, 2, border_radius=5)  # Border
         
         # Draw button text
-        button_text = self.font.render("Validate", True, self.validate_button_text_color)
-        text_x = button_x + (button_width - button_text.get_width()) // 2
-        text_y = button_y + (button_height - button_text.get_height()) // 2
-        self.screen.blit(button_text, (text_x, text_y))
+        button_text_width, button_text_height = self.font.size("Validate")
+        text_x = button_x + (button_width - button_text_width) // 2
+        text_y = button_y + (button_height - button_text_height) // 2
+        self._render_text_to(self.screen, self.font, self.font_ft, (text_x, text_y), "Validate", self.validate_button_text_color)
+
+    def _build_panel_cache(self, panel_padding: int, rules_rect_height: int, input_field_y_offset: int) -> pygame.Surface:
+        """Render the static parts of the panel into an off-screen surface"""
+        panel = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, self.panel_bg_color, panel_rect, border_radius=10) # Added rounded corners
+        pygame.draw.rect(panel, self.panel_border_color, panel_rect, 2, border_radius=10)
+        
+        # Draw title
+        title_text = "The Password Judge"
+        title_x = (self.width - self.title_font.size(title_text)[0]) // 2
+        self._render_text_to(panel, self.title_font, self.title_font_ft, (title_x, panel_padding), title_text, self.title_text_color)
+
+        # Draw message
+        message_text_y = panel_padding + self.title_font.get_height() + 5
+        message_x = (self.width - self.small_font.size(self.message)[0]) // 2
+        self._render_text_to(panel, self.small_font, self.small_font_ft, (message_x, message_text_y), self.message, self.message_color)
+
+        # Draw rules title
+        rules_title_text = "The Ruleset"
+        rules_title_x = (self.width - self.label_font.size(rules_title_text)[0]) // 2
+        rules_title_y = message_text_y + self.small_font.get_height() + 20  # Small gap after message
+        self._render_text_to(panel, self.label_font, self.label_font_ft, (rules_title_x, rules_title_y), rules_title_text, self.text_color)
+
+        # Rules rectangle sits below the rules title; the input label follows it
+        self._rules_rect_offset = rules_title_y + self.label_font.get_height() + 5  # Small gap after rules title
+        input_label_y = self._rules_rect_offset + rules_rect_height + input_field_y_offset
+        self._render_text_to(panel, self.font, self.font_ft, (panel_padding, input_label_y),
+                             "Type your password on the validator field:", self.text_color)
+        return panel
 
     def _validate_password(self):
         """Validate password and handle result"""
@@ -8,6 +8,10 @@ class PauseButton:
         self.screen = screen
         self.paused = False
         self._init_font()
+        
+        # Pause overlay and text are static; built on the first paused frame and reused
+        self._overlay: pygame.Surface | None = None
+        self._text_surfaces: tuple | None = None
 
     def _init_font(self):
         """Initialize font with fallback"""
@@ -48,15 +52,20 @@ class PauseButton:
         if not is_paused:
             return
             
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay (rebuilt only when the screen size changes)
+        if self._overlay is None or self._overlay.get_size() != self.screen.get_size():
+            self._overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 128))
+        self.screen.blit(self._overlay, (0, 0))
         
         # Draw pause text
-        pause_text = "PAUSED"
-        text_surface = self.font.render(pause_text, True, (255, 255, 255))
-        outline_surface = self.font.render(pause_text, True, (0, 0, 0))
+        if self._text_surfaces is None:
+            pause_text = "PAUSED"
+            self._text_surfaces = (
+                self.font.render(pause_text, True, (255, 255, 255)),
+                self.font.render(pause_text, True, (0, 0, 0))
+            )
+        text_surface, outline_surface = self._text_surfaces
         
         x = (self.screen.get_width() - text_surface.get_width()) // 2
         y = (self.screen.get_height() - text_surface.get_height()) // 2
@@ -31,8 +31,16 @@ class PopupNotification:
             'alpha': 255  # Start fully opaque
         })
     
+    @property
+    def active(self) -> bool:
+        """Whether any message is still on screen"""
+        return bool(self.messages)
+    
     def update(self):
         """Update message timers and fade out"""
+        if not self.messages:
+            return
+        
         current_time = pygame.time.get_ticks()
         
         # Update each message
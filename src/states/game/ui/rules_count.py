@@ -1,30 +1,43 @@
 import pygame
 import os
 
+# Rules font, resolved once at import
+_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', 'assets', 'fonts', 'UnifontEX.ttf')
+_FONT_EXISTS = os.path.exists(_FONT_PATH)
+
 class RulesCount:    
     """UI for displaying collected rules count"""
     
     def __init__(self, screen: pygame.Surface, ui_manager=None):
         self.screen = screen
         self.ui_manager = ui_manager
-        self._init_font()
+        
+        # Font is loaded on first render
+        self._font: pygame.font.Font | None = None
+        
+        # Composed panels (background, border and text) keyed by (text, colors); the text only changes on rule pickup
+        self._panel_cache: dict[tuple, pygame.Surface] = {}
+        self._panel_cache_size = 8
+        
+    @property
+    def font(self) -> pygame.font.Font:
+        """Font used for the counter, loaded on first access"""
+        if self._font is None:
+            self._init_font()
+        return self._font
         
     def _init_font(self):
         """Initialize font with fallback"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            main_dir = os.path.abspath(os.path.join(current_dir, '..', '..', '..', '..'))
-            font_path = os.path.join(main_dir, 'assets', 'fonts', 'UnifontEX.ttf')
-            
-            if os.path.exists(font_path):
-                self.font = pygame.font.Font(font_path, 20)  # Increased size for better visibility
+            if _FONT_EXISTS:
+                self._font = pygame.font.Font(_FONT_PATH, 20)  # Increased size for better visibility
                 print("Successfully loaded custom font for RulesCount: UnifontEX.ttf")
             else:
-                print(f"Warning: Font file not found at {font_path}")
-                self.font = pygame.font.Font(None, 20)
+                print(f"Warning: Font file not found at {_FONT_PATH}")
+                self._font = pygame.font.Font(None, 20)
         except (pygame.error, IOError) as e:
             print(f"Warning: Could not initialize font: {e}")
-            self.font = pygame.font.SysFont('arial', 20)
+            self._font = pygame.font.SysFont('arial', 20)
         
     def render(self, rules: list[str], total_rules: int = None):
         """Render the rules count display"""
@@ -44,16 +57,31 @@ class RulesCount:
         
         # Create text
         text_content = f"Rules Found: {current_rules}/{max_rules}"
+        cache_key = (text_content, text_color, bg_color, border_color)
+        panel = self._panel_cache.get(cache_key)
+        if panel is None:
+            panel = self._build_panel(text_content, text_color, bg_color, border_color, padding)
+            if len(self._panel_cache) >= self._panel_cache_size:
+                self._panel_cache.pop(next(iter(self._panel_cache)))  # Drop the oldest entry
+            self._panel_cache[cache_key] = panel
+        
+        self.screen.blit(panel, (x - padding, y - padding))
+        
+    def _build_panel(self, text_content: str, text_color: tuple, bg_color: tuple, border_color: tuple, padding: int) -> pygame.Surface:
+        """Draw the rounded background, border and text onto an off-screen surface"""
         text_surface = self.font.render(text_content, True, text_color)
         
         # Calculate dimensions
         width = text_surface.get_width() + padding * 2
         height = text_surface.get_height() + padding * 2
         
-        # Draw background panel
-        bg_rect = pygame.Rect(x - padding, y - padding, width, height)
-        pygame.draw.rect(self.screen, bg_color, bg_rect, border_radius=5)
-        pygame.draw.rect(self.screen, border_color, bg_rect, 1, border_radius=5)
+        # Drawing straight to the screen never blended the background, so keep it opaque here;
+        # only the rounded corners stay transparent
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        bg_rect = panel.get_rect()
+        pygame.draw.rect(panel, bg_color[:3], bg_rect, border_radius=5)
+        pygame.draw.rect(panel, border_color, bg_rect, 1, border_radius=5)
         
         # Draw text
-        self.screen.blit(text_surface, (x, y))
\ No newline at end of file
+        panel.blit(text_surface, (padding, padding))
+        return panel
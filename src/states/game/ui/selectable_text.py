@@ -1,9 +1,17 @@
+import re
 import pygame
 import pyperclip
+from bisect import bisect_right
+from ..utils.glyph_atlas import get_glyph_atlas
+from ..utils.fast_blits import fast_blits
 
 class SelectableText:
     """A text widget that supports selection and clipboard operations with scrolling"""
     
+    # Lines that start a new rule or header when copying to the clipboard
+    _RULE_PREFIX = re.compile(r'(?:[1-9]\.|Password Requirements:|•)')
+    _WHITESPACE = re.compile(r'\s+')
+    
     def __init__(
             self, text: str, 
             font: pygame.font.Font, 
@@ -21,6 +29,10 @@ class SelectableText:
         self.line_colors = [color] * len(self.lines)  # Default all lines to same color
         self.selection_bg_color = selection_bg_color
         
+        # Glyphs are rasterized once per font; per-line prefix widths make selection math a lookup
+        self.atlas = get_glyph_atlas(font)
+        self._update_prefix_widths()
+        
         # Selection state
         self.selection_start = None
         self.selection_end = None
@@ -50,11 +62,22 @@ class SelectableText:
         while len(self.line_colors) < len(self.lines):
             self.line_colors.append(self.default_color)
     
+    def _update_prefix_widths(self):
+        """Precompute cumulative character widths and the start index of every line"""
+        self._prefix_widths = [self.atlas.prefix_widths(line) for line in self.lines]
+        
+        self._line_start_char = []
+        char_count = 0
+        for line in self.lines:
+            self._line_start_char.append(char_count)
+            char_count += len(line) + 1
+    
     def update_content(self, text: str):
         """Update the text content and recalculate scroll parameters"""
         self.text = text
         self.lines = text.split('\n')
         self.line_colors = [self.default_color] * len(self.lines)
+        self._update_prefix_widths()
         
         # Recalculate scroll parameters
         self.max_visible_lines = max(1, self.rect.height // self.line_height)
@@ -125,18 +148,11 @@ class SelectableText:
         if actual_line_index >= len(self.lines):
             return len(self.text)
         
-        line = self.lines[actual_line_index]
-        char_index = 0
-        
-        for i, char in enumerate(line):
-            char_width = self.font.size(line[:i+1])[0]
-            if char_width > rel_x:
-                char_index = i
-                break
-            char_index = i + 1
+        # First character whose right edge lies past the cursor
+        char_index = max(0, bisect_right(self._prefix_widths[actual_line_index], rel_x) - 1)
         
         # Convert line-relative index to absolute index
-        abs_index = sum(len(self.lines[i]) + 1 for i in range(actual_line_index)) + char_index
+        abs_index = self._line_start_char[actual_line_index] + char_index
         return min(abs_index, len(self.text))
     
     def get_selected_text(self):
@@ -214,7 +230,7 @@ class SelectableText:
             else:
                 # Check if this line is a continuation of a wrapped rule
                 if (cleaned_lines and 
-                    not line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.', 'Password Requirements:', '•')) and
+                    self._RULE_PREFIX.match(line) is None and
                     not line.endswith('????')):
                     # This is likely a wrapped continuation - join with previous line
                     if cleaned_lines:
@@ -227,7 +243,7 @@ class SelectableText:
         result = '\n'.join(cleaned_lines)
         
         # Remove any remaining double spaces
-        result = ' '.join(result.split())
+        result = self._WHITESPACE.sub(' ', result).strip()
         
         # Add back proper line breaks between rules
         result = result.replace('. ', '.\n').replace('Requirements:', 'Requirements:\n')
@@ -241,30 +257,33 @@ class SelectableText:
         end_line = min(len(self.lines), start_line + self.max_visible_lines)
         
         y_offset = 0
-        char_index = sum(len(self.lines[i]) + 1 for i in range(start_line))
-        
         text_padding_x = 10 # Added horizontal padding
+        line_blits = [] # Glyph blits for all visible lines, drawn in one call after the highlights
+        
+        # Resolve the selection once; an empty selection draws no highlight
+        has_selection = (self.selection_start is not None and self.selection_end is not None
+                         and self.selection_start != self.selection_end)
+        if has_selection:
+            start = min(self.selection_start, self.selection_end)
+            end = max(self.selection_start, self.selection_end)
 
         # Draw visible lines
         for line_idx in range(start_line, end_line):
             line = self.lines[line_idx]
             color = self.line_colors[line_idx] if line_idx < len(self.line_colors) else self.default_color
-            line_surface = self.font.render(line, True, color)
+            prefix_widths = self._prefix_widths[line_idx]
             
             # Draw selection highlighting for this line
-            if self.selection_start is not None and self.selection_end is not None:
-                start = min(self.selection_start, self.selection_end)
-                end = max(self.selection_start, self.selection_end)
-                
-                line_start_char_idx = sum(len(self.lines[i]) + 1 for i in range(line_idx)) # char index at start of this line
+            if has_selection:
+                line_start_char_idx = self._line_start_char[line_idx] # char index at start of this line
                 
                 if start < line_start_char_idx + len(line) and end > line_start_char_idx:
                     sel_start_in_line = max(0, start - line_start_char_idx)
                     sel_end_in_line = min(len(line), end - line_start_char_idx)
                     
                     if sel_start_in_line < sel_end_in_line:
-                        start_x_offset = self.font.size(line[:sel_start_in_line])[0] if sel_start_in_line > 0 else 0
-                        end_x_offset = self.font.size(line[:sel_end_in_line])[0]
+                        start_x_offset = prefix_widths[sel_start_in_line]
+                        end_x_offset = prefix_widths[sel_end_in_line]
                         
                         sel_rect = pygame.Rect(
                             self.rect.x + text_padding_x + start_x_offset,
@@ -274,28 +293,25 @@ class SelectableText:
                         )
                         pygame.draw.rect(screen, self.selection_bg_color, sel_rect)
             
-            # Draw the text
-            screen.blit(line_surface, (self.rect.x + text_padding_x, self.rect.y + y_offset))
+            # Queue the text from cached glyphs
+            line_blits.extend(self.atlas.line_blits(line, color, self.rect.x + text_padding_x, self.rect.y + y_offset))
             y_offset += self.line_height
 
+        # Draw the text
+        fast_blits(screen, line_blits)
+
         # Draw cursor if visible and text is selected
         if self.interactive and self.cursor_visible and self.selection_start is not None:
             cursor_pos = self.selection_end if self.selection_end is not None else self.selection_start
             
             # Calculate cursor position
-            line_idx = 0
-            char_count = 0
-            for i, line in enumerate(self.lines):
-                if char_count + len(line) + 1 > cursor_pos:
-                    line_idx = i
-                    break
-                char_count += len(line) + 1
+            line_idx = max(0, bisect_right(self._line_start_char, cursor_pos) - 1)
+            char_count = self._line_start_char[line_idx]
             
             # Only draw if cursor is in visible area
             if line_idx >= start_line and line_idx < end_line:
-                local_cursor_pos = cursor_pos - char_count
-                cursor_x = self.rect.x + text_padding_x + \
-                        self.font.size(self.lines[line_idx][:local_cursor_pos])[0]
+                local_cursor_pos = min(cursor_pos - char_count, len(self.lines[line_idx]))
+                cursor_x = self.rect.x + text_padding_x + self._prefix_widths[line_idx][local_cursor_pos]
                 cursor_y = self.rect.y + (line_idx - start_line) * self.line_height
                 
                 # Draw cursor line
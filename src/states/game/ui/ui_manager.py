@@ -7,6 +7,8 @@ from .compass import Compass
 from .hud import HUD
 from .pause_button import PauseButton
 from .popup_notification import PopupNotification
+from .frame_data import FrameData
+from ..utils.fast_blits import fast_blits
 
 class UIManager:
     """Manages all UI components and their interactions"""
@@ -39,6 +41,29 @@ class UIManager:
             self.pause_button = PauseButton(self.screen)
             self.popup = PopupNotification(self.screen)
             
+            # Optional rules UI hooks, probed once instead of every frame
+            self._rules_update = getattr(self.rules_ui, 'update', None)
+            
+            # Event handlers by event type, in priority order; other event types are never consumed
+            handlers = [self.password_ui.handle_event]
+            if hasattr(self.rules_ui, 'handle_event'):
+                handlers.append(self.rules_ui.handle_event)
+            self._event_handlers = {
+                event_type: handlers
+                for event_type in (
+                    pygame.KEYDOWN, pygame.KEYUP,
+                    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                    pygame.MOUSEMOTION, pygame.MOUSEWHEEL
+                )
+            }
+            
+            # Bound render methods, resolved once for the per-frame render path
+            self._render_hud = self.hud.render
+            self._render_dialogue = self.dialogue_box.render
+            self._render_rules = self.rules_ui.render
+            self._render_password = self.password_ui.render
+            self._render_popup = self.popup.render
+            
         except Exception as e:
             print(f"Error initializing UI components: {e}")
             raise
@@ -56,103 +81,93 @@ class UIManager:
             
     def update(self, delta_time: float):
         """Update all UI components"""
-        try:
+        # Timed popups and the typewriter only need ticking while they are on screen
+        if self.popup.active:
             self.popup.update()
+        if self.dialogue_box.is_active:
             self.dialogue_box.update()
-            self.password_ui.update(delta_time)
-            if hasattr(self.rules_ui, 'update'):
-                self.rules_ui.update(delta_time)
-            if hasattr(self.password_ui, 'rules_text') and self.password_ui.rules_text is not None:
-                self.password_ui.rules_text.update(delta_time)
-        except Exception as e:
-            print(f"Error updating UI: {e}")
+        self.password_ui.update(delta_time)
+        if self._rules_update:
+            self._rules_update(delta_time)
+        self.password_ui.update_rules_text(delta_time)
             
-    def render(self, game_data: dict):
+    def render(self, frame: FrameData):
         """Render all UI components"""
-        try:
-            # Render HUD elements
-            if self.show_speed_debug:
-                self.hud.draw_speed_indicator(game_data.get('player_speed', 0))
-            self.hud.draw_zoom_indicator(game_data.get('camera_zoom', 1.0))
-
-            # Render compass if we have door data
-            nearest_door = game_data.get('nearest_door')
-            if nearest_door:
-                self.compass.draw(
-                    nearest_door,
-                    game_data.get('door_angle', 0)
-                )
+        hud = self.hud
+        
+        # Render HUD elements; the text indicators are plain blits, so draw them in one call
+        hud_blits = []
+        if self.show_speed_debug:
+            hud_blits += hud.speed_indicator_blits(frame.player_speed)
+        hud_blits += hud.zoom_indicator_blits(frame.camera_zoom)
+        fast_blits(self.screen, hud_blits)
 
-            self.hud.render()
-                
-            # Render interactive UI elements
-            self.dialogue_box.render()
-            self.rules_ui.render(
-                game_data.get('current_rules', []),
-                game_data.get('total_rules', None)
+        # Render compass if we have door data
+        nearest_door = frame.nearest_door
+        if nearest_door:
+            self.compass.draw(
+                nearest_door,
+                frame.door_angle
             )
-            self.password_ui.render()
+
+        self._render_hud()
             
-            # Render pause button if game is paused
-            if game_data.get('paused', False):
-                self.pause_button.draw(paused=True)
-                
-            # Render debug info if enabled
-            if self.show_coordinates:
-                self._render_debug_info(game_data)
+        # Render interactive UI elements
+        self._render_dialogue()
+        self._render_rules(
+            frame.current_rules,
+            frame.total_rules
+        )
+        self._render_password()
+        
+        # Render pause button if game is paused
+        if frame.paused:
+            self.pause_button.draw(paused=True)
+            
+        # Render debug info if enabled
+        if self.show_coordinates:
+            self._render_debug_info(frame)
 
-            self.popup.render()
-                
-        except Exception as e:
-            print(f"Error rendering UI: {e}")
+        self._render_popup()
             
-    def _render_debug_info(self, game_data: dict):
+    def _render_debug_info(self, frame: FrameData):
         """Render debug information when enabled"""
         try:
             if hasattr(self.hud, 'draw_debug_info'):
                 self.hud.draw_debug_info(
-                    player_pos=game_data.get('player_pos'),
-                    mouse_pos=game_data.get('mouse_pos'),
-                    fps=game_data.get('fps'),
-                    additional_info=game_data.get('debug_info', {})
+                    player_pos=frame.player_pos,
+                    mouse_pos=frame.mouse_pos,
+                    fps=frame.fps,
+                    additional_info=frame.debug_info
                 )
         except Exception as e:
             print(f"Error rendering debug info: {e}")
             
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle UI-related events"""
-        try:
-            # Always allow fullscreen toggle
-            if event.type == pygame.KEYDOWN:
-                if (event.key == pygame.K_RETURN and pygame.key.get_mods() & pygame.KMOD_ALT) or \
-                event.key == pygame.K_F11:
-                    return False  # Let the main game handle fullscreen toggle
-            
-            # If dialogue box is active, only handle its events and fullscreen
-            if self.dialogue_box.is_active:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-                    if not self.dialogue_box.typing_complete:
-                        self.dialogue_box.complete_typing()
-                        return True
-                    else:
-                        self.dialogue_box.hide()
-                        return True 
-                return True
-            
-            # Handle other UI events as normal
-            if self.password_ui.handle_event(event):
-                return True
-                
-            # Let rules UI handle events next
-            if hasattr(self.rules_ui, 'handle_event'):
-                if self.rules_ui.handle_event(event):
+        # Always allow fullscreen toggle
+        if event.type == pygame.KEYDOWN:
+            if (event.key == pygame.K_RETURN and pygame.key.get_mods() & pygame.KMOD_ALT) or \
+            event.key == pygame.K_F11:
+                return False  # Let the main game handle fullscreen toggle
+        
+        # If dialogue box is active, only handle its events and fullscreen
+        if self.dialogue_box.is_active:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
+                if not self.dialogue_box.typing_complete:
+                    self.dialogue_box.complete_typing()
                     return True
-                    
-            return False
+                else:
+                    self.dialogue_box.hide()
+                    return True 
+            return True
+        
+        # Handle other UI events as normal: password UI first, then the rules UI
+        for handler in self._event_handlers.get(event.type, ()):
+            if handler(event):
+                return True
                 
-        except Exception as e:
-            print(f"Error handling UI event: {e}")
-            return False
+        return False
         
     def show(self, rules: list[str], door, callback: callable = None, collected_rules: list[str] = None, 
          preserved_password: str = "", close_callback: callable = None):
@@ -0,0 +1,20 @@
+import pygame
+
+def fast_blits(surface: pygame.Surface, blit_sequence: list[tuple]) -> None:
+    """
+    Blit a sequence of (source, dest) pairs in a single call
+    
+    Uses pygame-ce's Surface.fblits when available and falls back to Surface.blits.
+    
+    Args:
+        surface: Surface to draw on
+        blit_sequence: List of (source surface, destination position) pairs
+    """
+    if not blit_sequence:
+        return
+    
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
@@ -0,0 +1,61 @@
+import pygame
+
+class GlyphAtlas:
+    """Caches rasterized glyphs and their advances for a single font"""
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.glyphs: dict[tuple, pygame.Surface] = {}  # (char, color) -> pre-tinted glyph surface
+        self.advance: dict[str, int] = {}  # char -> horizontal advance in pixels
+
+    def get_advance(self, char: str) -> int:
+        """Get the advance width of a character, measuring it on first use"""
+        advance = self.advance.get(char)
+        if advance is None:
+            advance = self.font.size(char)[0]
+            self.advance[char] = advance
+        return advance
+
+    def get_glyph(self, char: str, color: tuple) -> pygame.Surface:
+        """Get the rendered glyph for a character in the given color"""
+        key = (char, color)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            glyph = self.font.render(char, True, color)
+            if pygame.display.get_surface() is not None:
+                glyph = glyph.convert_alpha()  # Match the display format so glyph blits take the fast path
+            self.glyphs[key] = glyph
+        return glyph
+
+    def prefix_widths(self, line: str) -> list[int]:
+        """
+        Get cumulative advances for a line
+
+        Returns:
+            List of len(line) + 1 widths where entry i is the pixel width of line[:i]
+        """
+        widths = [0]
+        total = 0
+        for char in line:
+            total += self.get_advance(char)
+            widths.append(total)
+        return widths
+
+    def line_blits(self, line: str, color: tuple, x: int, y: int) -> list[tuple]:
+        """Build (glyph, position) pairs for drawing a line starting at (x, y)"""
+        blits = []
+        for char in line:
+            if not char.isspace():
+                blits.append((self.get_glyph(char, color), (x, y)))
+            x += self.get_advance(char)
+        return blits
+
+_atlases: dict[pygame.font.Font, GlyphAtlas] = {}
+
+def get_glyph_atlas(font: pygame.font.Font) -> GlyphAtlas:
+    """Get the shared glyph atlas for a font"""
+    atlas = _atlases.get(font)
+    if atlas is None:
+        atlas = GlyphAtlas(font)
+        _atlases[font] = atlas
+    return atlas
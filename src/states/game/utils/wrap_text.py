@@ -1,38 +1,77 @@
 import pygame
+from bisect import bisect_right
+from itertools import accumulate
+
+# Wrapped lines keyed by (font, max_width, text); rules and dialogue text rarely change between calls
+_WRAP_CACHE: dict[tuple, tuple[str, ...]] = {}
+_WRAP_CACHE_SIZE = 256
 
 def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
     """
     Wrap text to fit within max_width pixels, handling text without spaces
+
+    Results are memoized per font, width and text; call wrap_text.cache.clear()
+    after reloading fonts.
+    """
+    key = (font, max_width, text)
+    lines = _WRAP_CACHE.get(key)
+    if lines is None:
+        lines = tuple(_wrap_text(text, font, max_width))
+        if len(_WRAP_CACHE) >= _WRAP_CACHE_SIZE:
+            _WRAP_CACHE.pop(next(iter(_WRAP_CACHE)))  # Drop the oldest entry
+        _WRAP_CACHE[key] = lines
+    return list(lines)
+
+wrap_text.cache = _WRAP_CACHE
+
+def _wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
+    """
+    Wrap text without memoization
+
+    The advance of every character in a paragraph is read with a single
+    font.metrics call; each break is found by bisecting their running sums.
+    Hinting and kerning can make a rendered line slightly wider or narrower
+    than its summed advances, so the break is then confirmed with font.size,
+    which normally takes one or two calls per line. Because whole lines are
+    measured, kerned fonts can break a character earlier or later than a sum
+    of per-character widths would.
     """
     if not text.strip():
         return [text]
-    
-    paragraphs = text.split('\n')
+
     wrapped_lines = []
-    
-    for paragraph in paragraphs:
+    append = wrapped_lines.append
+
+    for paragraph in text.split('\n'):
         if not paragraph.strip():
-            wrapped_lines.append('')
+            append('')
             continue
-            
-        current_line = []
-        remaining_width = max_width
-        
-        # Process each character individually
-        for char in paragraph:
-            char_width = font.size(char)[0]
-            
-            if char_width <= remaining_width:
-                current_line.append(char)
-                remaining_width -= char_width
-            else:
-                # Save current line and start a new one
-                wrapped_lines.append(''.join(current_line))
-                current_line = [char]
-                remaining_width = max_width - char_width
-        
-        # Add remaining characters
-        if current_line:
-            wrapped_lines.append(''.join(current_line))
-    
-    return wrapped_lines
\ No newline at end of file
+
+        # Glyphs missing from the font report no metrics; measure those directly
+        advances = [
+            metric[4] if metric is not None else font.size(char)[0]
+            for char, metric in zip(paragraph, font.metrics(paragraph))
+        ]
+
+        # offsets[k] is the summed advance of paragraph[:k]
+        offsets = [0, *accumulate(advances)]
+
+        length = len(paragraph)
+        i = 0
+
+        while i < length:
+            # Estimate the break from the summed advances (always keep at least one character)
+            j = max(i + 1, bisect_right(offsets, offsets[i] + max_width, i + 1) - 1)
+
+            # Expand while the next character still fits
+            while j < length and font.size(paragraph[i:j + 1])[0] <= max_width:
+                j += 1
+
+            # Contract until the line fits
+            while j > i + 1 and font.size(paragraph[i:j])[0] > max_width:
+                j -= 1
+
+            append(paragraph[i:j])
+            i = j
+
+    return wrapped_lines
@@ -1,29 +1,159 @@
 import pygame
 import sys
 import math
-import random
-import os
+import concurrent.futures
+from collections import defaultdict
+import numpy as np
+from pathlib import Path
 from typing import Dict, Any, Set, Tuple, List
 
-# Add src directory to path so we can import modules
-src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
+# Add src directory to path so we can import modules when run as a script;
+# when imported (e.g. from main.py) it is already importable
+_SRC_DIR = str(Path(__file__).resolve().parents[1])
+if __name__ == "__main__" and _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from levels.manager import LayeredLevelManager
 from rules import game_state
-from entities.interactables import interactable_manager
+from entities.interactables import (
+    interactable_manager, Door, EmptyInteractable, MultiTileEmptyInteractable, Note, MultiTileNote
+)
 from states.game.ui.ui_manager import UIManager
+from states.game.ui.frame_data import FrameData
+from states.game.utils.fast_blits import fast_blits
 from entities.player import Player
 from ui.crt_filter import CRTFilter
+from constants import (
+    MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER, MIXER_NUM_CHANNELS,
+    SFX_RESERVED_CHANNELS, SFX_CHANNEL_CLICK, SFX_CHANNEL_INTERACT, SFX_CHANNEL_NPC,
+    SFX_CHANNEL_SUCCESS, SFX_CHANNEL_INVALID
+)
+
+# Event types the game never handles; blocked while the game loop runs so SDL
+# doesn't queue them and pygame doesn't wrap them in Event objects every frame.
+# TEXTINPUT must stay allowed: pygame fills KEYDOWN.unicode from it.
+_UNUSED_EVENT_TYPES = [
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+    pygame.CONTROLLERTOUCHPADDOWN, pygame.CONTROLLERTOUCHPADMOTION, pygame.CONTROLLERTOUCHPADUP,
+    pygame.CONTROLLERSENSORUPDATE,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+    pygame.DROPFILE, pygame.DROPTEXT, pygame.DROPBEGIN, pygame.DROPCOMPLETE,
+]
+
+# Door count from which the nearest-door search runs in NumPy; below it the
+# array setup costs more than a plain loop.
+_VECTORIZED_DOOR_SEARCH_MIN = 32
+
+# Nearby interactables are rechecked every this many frames (~10 Hz at 60 FPS),
+# or sooner once the player has moved more than this many pixels.
+_PROXIMITY_CHECK_INTERVAL = 6
+_PROXIMITY_MOVE_THRESHOLD = 8
+
+# Game logic runs at a fixed 60 Hz regardless of the frame rate, with at most this
+# many catch-up updates per rendered frame
+_UPDATE_STEP_MS = 1000 / 60
+_MAX_UPDATES_PER_FRAME = 5
+
+# The FPS title bar is refreshed every this many frames (~4 Hz at 60 FPS); setting
+# the caption is a round-trip to the window manager
+_CAPTION_UPDATE_INTERVAL = 15
+
+# Interactables are bucketed into chunks of 2**_GRID_CHUNK_SHIFT tiles per side so
+# debug overlays only visit the ones near the viewport
+_GRID_CHUNK_SHIFT = 4
+
+# The pause static is drawn into a tile this size and wrapped across the screen
+_NOISE_TILE_SIZE = (256, 256)
+
+# Errors raised on per-frame paths are printed at most once per this many milliseconds,
+# so a persistent failure doesn't stall every frame on terminal output
+_ERROR_LOG_INTERVAL_MS = 1000
+
+# Debug outline colors by interactable type, for objects that aren't collected or open
+_INTERACTABLE_COLORS = {
+    Door: (255, 0, 255),                        # Magenta for locked doors
+    EmptyInteractable: (150, 150, 150),         # Light gray for empty interactables
+    MultiTileEmptyInteractable: (150, 150, 150),
+    Note: (0, 255, 0),                          # Green for notes with rules
+    MultiTileNote: (0, 255, 0),
+}
+_DEFAULT_INTERACTABLE_COLOR = (255, 255, 0)     # Yellow for unknown/other types
+
+def _tiles_to_rects(tiles) -> list[pygame.Rect]:
+    """Cover a set of (x, y) tiles with rectangles in tile units: maximal runs along each
+    row, merged downwards while the next row has a run with the same span"""
+    rows = defaultdict(list)
+    for tile_x, tile_y in tiles:
+        rows[tile_y].append(tile_x)
+    
+    rects = []
+    open_rects = {}  # (first x, last x) -> rect that reached the previous row
+    for tile_y in sorted(rows):
+        row_rects = {}
+        xs = sorted(rows[tile_y])
+        start = end = xs[0]
+        for tile_x in xs[1:] + [None]:
+            if tile_x is not None and tile_x == end + 1:
+                end = tile_x
+                continue
+            
+            # The run ended; extend the rect above when it covers exactly the same span
+            rect = open_rects.get((start, end))
+            if rect is not None and rect.bottom == tile_y:
+                rect.height += 1
+            else:
+                rect = pygame.Rect(start, tile_y, end - start + 1, 1)
+                rects.append(rect)
+            row_rects[start, end] = rect
+            
+            if tile_x is not None:
+                start = end = tile_x
+        open_rects = row_rects
+    return rects
 
 class GameDemo:
     """Demo showing the layered tileset renderer in action"""
     
+    # Every instance attribute, declared up front so attribute access skips the instance dict
+    __slots__ = (
+        # Display
+        'screen', 'screen_width', 'screen_height', 'is_fullscreen',
+        'user_screen_width', 'user_screen_height', 'windowed_size',
+        # Game loop
+        'running', 'game_completed', 'paused', 'clock', 'fps', 'dt', '_keys',
+        '_frame_data', '_proximity_frame', '_last_proximity_pos',
+        '_io_executor', '_pending_level',
+        # Pause effects
+        '_dim_surface', '_noise_surface', '_noise_points', '_paused_frame',
+        # Level and interactable caches
+        '_doors', '_door_positions', '_door_xy', '_interactable_grid', '_tile_index',
+        # Debug and creation mode
+        'show_debug', 'show_speed_debug', 'show_coordinates', 'smooth_camera',
+        'creation_mode', 'creation_type', 'delete_mode', 'selected_tiles',
+        'mouse_x', 'mouse_y', 'mouse_tile_x', 'mouse_tile_y',
+        '_outline_stamps',
+        '_highlight_cache',
+        '_highlight_layouts',
+        '_error_log_times',
+        '_key_handlers', '_debug_key_handlers', '_creation_key_handlers',
+        # Game objects and progress
+        'level_manager', 'player', 'ui_manager', '_player_pos', '_player_tile',
+        'last_successful_password', 'is_transitioning',
+        'accumulated_rules', '_accumulated_rule_set', 'used_rules', 'current_level_rules',
+        # Sound effects and their channels
+        'interact_sfx', 'npc_sfx', 'click_sfx', 'success_sfx', 'invalid_sfx',
+        '_click_channel', '_interact_channel', '_npc_channel', '_success_channel', '_invalid_channel',
+    )
+    
     def __init__(self, screen=None):
         # Initialize Pygame if not already done
         if not pygame.get_init():
+            pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
             pygame.init()
+            pygame.mixer.set_num_channels(MIXER_NUM_CHANNELS)
+            pygame.mixer.set_reserved(SFX_RESERVED_CHANNELS)
 
         if screen is not None:
             # Use provided screen (windowed mode from main.py)
@@ -54,9 +184,41 @@ class GameDemo:
         self.game_completed = False  # Flag to track if level-4 is completed
         self.paused = False
         self.clock = pygame.time.Clock()
-        self.fps = 60  # Target FPS for game loop
+        self.fps = 60  # Frame rate cap; game logic steps at a fixed 60 Hz (see run)
         self.dt = 0.0
         
+        # Per-frame UI state, reused and refreshed by render
+        self._frame_data = FrameData()
+        
+        # Proximity check throttling: frames counted and player position at the last check
+        self._proximity_frame = 0
+        self._last_proximity_pos = None
+        
+        # Held-key state for the current frame, refreshed by run after event polling
+        self._keys = pygame.key.get_pressed()
+        
+        # Background level loading: a single worker and the (level name, future) being loaded
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_level = None
+        
+        # Pause effects: dimming overlay, color-keyed noise tile and the pixels lit on it last frame,
+        # and the dimmed scene captured on the first paused frame
+        self._dim_surface = None
+        self._noise_surface = None
+        self._noise_points = None
+        self._paused_frame = None
+        
+        # Doors and their tile positions for the compass, collected when the level's interactables load
+        self._doors: List[Door] = []
+        self._door_positions: List[Tuple[int, int]] = []
+        self._door_xy = np.empty((0, 2), dtype=np.int32)
+        
+        # Interactable tiles bucketed by chunk for the coordinate debug overlay
+        self._interactable_grid: Dict[Tuple[int, int], list] = {}
+        
+        # Interactables by each tile they cover, for the proximity hints
+        self._tile_index: Dict[Tuple[int, int], list] = {}
+        
         # Debug and creation mode variables
         self.show_debug = False
         self.show_speed_debug = False
@@ -73,6 +235,19 @@ class GameDemo:
         self.mouse_tile_x = 0
         self.mouse_tile_y = 0
         
+        # Pre-drawn interactable outlines keyed by (color, multi-tile, tile size, corner size)
+        self._outline_stamps: Dict[tuple, pygame.Surface] = {}
+        
+        # Proximity highlight rectangles keyed by (size in tiles, zoom, border color, edge masks)
+        self._highlight_cache: Dict[tuple, pygame.Surface] = {}
+        
+        # Rectangles and border edge masks for each highlighted tile group; groups only
+        # change when the player walks up to different interactables
+        self._highlight_layouts: Dict[frozenset, list] = {}
+        
+        # When each rate-limited error message was last printed, keyed by where it came from
+        self._error_log_times: Dict[str, int] = {}
+        
         # Initialize level manager with layered rendering
         self.level_manager = LayeredLevelManager(
             self.screen, 
@@ -81,6 +256,10 @@ class GameDemo:
 
         # Replace player variables with Player instance
         self.player = Player()
+        
+        # Player pixel and tile position, cached once per frame (see _refresh_player_position)
+        self._player_pos = (0, 0)
+        self._player_tile = (0, 0)
 
         # Level transition persistence
         self.last_successful_password = ""
@@ -101,6 +280,7 @@ class GameDemo:
                 self.load_level_interactables()
             else:
                 print("No levels found! Make sure your level files are in the correct directory.")
+        self._refresh_player_position()
         
         self.ui_manager = UIManager(self.screen)
         
@@ -122,6 +302,7 @@ class GameDemo:
         self.last_successful_password = ""
         self.is_transitioning = False
         self.accumulated_rules = []  # Rules from all previously completed levels
+        self._accumulated_rule_set = set()  # Same rules, for membership checks; the list keeps their order
         self.used_rules = set()  # Track rules that have been used in any level
         self.current_level_rules = []  # Rules found in the current level only (resets each level)
         
@@ -136,7 +317,51 @@ class GameDemo:
         self.success_sfx.set_volume(0.3)
         self.invalid_sfx = pygame.mixer.Sound('assets/audio/invalid.mp3')
         self.invalid_sfx.set_volume(0.3)
+        
+        # Each sound effect plays on its own reserved channel (reserved once, when the mixer is set up),
+        # so a replay cuts the previous one off instead of the mixer searching for a free channel
+        self._click_channel = pygame.mixer.Channel(SFX_CHANNEL_CLICK)
+        self._interact_channel = pygame.mixer.Channel(SFX_CHANNEL_INTERACT)
+        self._npc_channel = pygame.mixer.Channel(SFX_CHANNEL_NPC)
+        self._success_channel = pygame.mixer.Channel(SFX_CHANNEL_SUCCESS)
+        self._invalid_channel = pygame.mixer.Channel(SFX_CHANNEL_INVALID)
         # Removed setup_level_interactables() call since programmable setups are not being used
+        
+        self._init_key_handlers()
+
+    def _init_key_handlers(self):
+        """Build the KEYDOWN dispatch tables; each key is handled by at most one table"""
+        # Keys that are always live
+        self._key_handlers = {
+            pygame.K_e: self._handle_interact_key,
+            pygame.K_ESCAPE: self._handle_escape_key,
+            pygame.K_SPACE: self._handle_pause_key,
+            pygame.K_F1: self._toggle_debug,
+            pygame.K_F2: self._toggle_smooth_camera,
+            pygame.K_F3: self._toggle_coordinates,
+            pygame.K_F4: self._toggle_creation_mode,
+            pygame.K_F5: self._toggle_speed_debug,
+        }
+        
+        # Debug keys, only live while coordinates are shown
+        self._debug_key_handlers = {
+            pygame.K_n: self._load_next_level,
+            pygame.K_RIGHT: self._load_next_level,
+            pygame.K_p: self._load_previous_level,
+            pygame.K_LEFT: self._load_previous_level,
+            pygame.K_r: self._restart_level,
+            pygame.K_c: self._clear_rules,
+            pygame.K_i: self._show_interactables_info,
+            pygame.K_x: self._copy_mouse_coordinates,
+            pygame.K_DELETE: self._clean_duplicate_interactables,
+            pygame.K_z: self._force_reload_level,
+        }
+        
+        # Creation mode keys
+        self._creation_key_handlers = {
+            pygame.K_TAB: self._cycle_creation_type,
+            pygame.K_RETURN: self._handle_create_key,
+        }
 
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
@@ -152,9 +377,13 @@ class GameDemo:
             self.screen = pygame.display.set_mode(self.windowed_size)
             self.screen_width, self.screen_height = self.windowed_size
         
-        # Update UI components that depend on screen size
-        if hasattr(self.ui_manager, 'dialogue_box'):
-            self.ui_manager.dialogue_box._init_dimensions()
+        # Pause overlays are rebuilt for the new display surface
+        self._dim_surface = None
+        self._noise_surface = None
+        self._paused_frame = None
+        
+        # Update UI components that depend on screen size (UIManager always creates them)
+        self.ui_manager.dialogue_box._init_dimensions()
         
         # Show message about the change
         mode = "Fullscreen" if self.is_fullscreen else "Windowed"
@@ -162,7 +391,20 @@ class GameDemo:
     
     def handle_events(self):
         """Handle input events"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        
+        # Only the latest pointer position matters, so drop all but the last motion event
+        # (kept in place so it stays ordered with button events)
+        last_motion = None
+        for event in reversed(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = event
+                break
+        
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and event is not last_motion:
+                continue
+            
             if event.type == pygame.QUIT:
                 return False
             
@@ -195,117 +437,123 @@ class GameDemo:
                     self.toggle_fullscreen()
                     continue
 
-                # Dialog and interaction handling
-                if event.key == pygame.K_e:
-                    if self.ui_manager.dialogue_box.is_active:
-                        self.click_sfx.play()  # Play click sound when skipping/exiting dialogue
-                        if self.ui_manager.dialogue_box.is_animating:
-                            self.ui_manager.dialogue_box.skip_animation()  # Skip animation
-                        else:
-                            self.ui_manager.dialogue_box.hide()  # Close dialogue
-                    elif not self.paused:
-                        self.interact_with_objects()
-                
-                # Handle pause toggle
-                elif event.key == pygame.K_ESCAPE:
-                    if self.ui_manager.password_ui.visible:
-                        self.click_sfx.play()
-                        self.ui_manager.password_ui.hide()
-                    else:
-                        self.click_sfx.play()
-                        self.paused = not self.paused
-                    continue
-                elif event.key == pygame.K_SPACE:
-                    if not self.ui_manager.password_ui.visible:
-                        self.click_sfx.play()
-                        self.paused = not self.paused
-                    continue
-
-                # Level navigation (debug mode)
-                elif (event.key == pygame.K_n or event.key == pygame.K_RIGHT) and self.ui_manager.hud.show_coordinates:
-                    if self.level_manager.load_next_level():
-                        start_x, start_y = self.level_manager.get_level_starting_point()
-                        self.player.set_position(start_x, start_y)
-                        self.load_level_interactables()
-                
-                elif (event.key == pygame.K_p or event.key == pygame.K_LEFT) and self.ui_manager.hud.show_coordinates:
-                    if self.level_manager.load_previous_level():
-                        start_x, start_y = self.level_manager.get_level_starting_point()
-                        self.player.set_position(start_x, start_y)
-                        self.load_level_interactables()
-                
-                elif event.key == pygame.K_r and self.ui_manager.hud.show_coordinates:
-                    current_name = self.level_manager.current_level_name
-                    if current_name:
-                        if self.level_manager.load_level(current_name):
-                            start_x, start_y = self.level_manager.get_level_starting_point()
-                            self.player.set_position(start_x, start_y)
-                            self.load_level_interactables()
-                
-                # Debug toggles
-                elif event.key == pygame.K_F1:
-                    self.show_debug = not self.show_debug
-                
-                elif event.key == pygame.K_F2:
-                    self.smooth_camera = not self.smooth_camera
-                
-                elif event.key == pygame.K_F3:
-                    self.ui_manager.hud.show_coordinates = not self.ui_manager.hud.show_coordinates
-                
-                elif event.key == pygame.K_F4:
-                    self.creation_mode = not self.creation_mode
-                    if not self.creation_mode:
-                        self.selected_tiles.clear()
-                        self.delete_mode = False
-                    self.ui_manager.show_message(
-                        f"Creation mode: {'ON' if self.creation_mode else 'OFF'} ({self.creation_type})", 2000
-                    )
-                
-                elif event.key == pygame.K_TAB and self.creation_mode:
-                    if self.creation_type == "note":
-                        self.creation_type = "door"
-                        self.delete_mode = False
-                    elif self.creation_type == "door":
-                        self.creation_type = "delete"
-                        self.delete_mode = True
-                    else:  # delete mode
-                        self.creation_type = "note"
-                        self.delete_mode = False
-                    
-                    self.selected_tiles.clear()
-                    mode_text = "DELETE" if self.delete_mode else self.creation_type.upper()
-                    self.ui_manager.show_message(f"Creation mode: {mode_text}", 2000)
-                
-                elif event.key == pygame.K_F5:
-                    self.ui_manager.hud.show_speed_debug = not self.ui_manager.hud.show_speed_debug
-
-                # Other debug functions
-                elif event.key == pygame.K_c and self.ui_manager.hud.show_coordinates:
-                    game_state.clear_rules_for_testing()
-                    self.ui_manager.show_message("Rules cleared for testing!", 2000)
-                
-                elif event.key == pygame.K_i and self.ui_manager.hud.show_coordinates:
-                    self._show_interactables_info()
-                
-                elif event.key == pygame.K_x and self.ui_manager.hud.show_coordinates:
-                    self._copy_mouse_coordinates()
-                
-                elif event.key == pygame.K_DELETE and self.ui_manager.hud.show_coordinates:
-                    self._clean_duplicate_interactables()
-                
-                elif event.key == pygame.K_z and self.ui_manager.hud.show_coordinates:
-                    current_name = self.level_manager.current_level_name
-                    if current_name and self.level_manager.load_level(current_name):
-                        self.load_level_interactables()
-                
-                elif event.key == pygame.K_RETURN and self.creation_mode:
-                    if not self.delete_mode:
-                        self._create_and_save_interactable()
-                    else:
-                        self.ui_manager.show_message("Cannot create in delete mode - use TAB to switch modes", 2000)
+                handler = self._key_handlers.get(event.key)
+                if handler is None and self.ui_manager.hud.show_coordinates:
+                    handler = self._debug_key_handlers.get(event.key)
+                if handler is None and self.creation_mode:
+                    handler = self._creation_key_handlers.get(event.key)
+                if handler:
+                    handler()
+                    # Debug toggles and level jumps also run while paused; recapture the scene
+                    self._paused_frame = None
 
         return True
     
+    def _handle_interact_key(self):
+        """Skip or close the dialogue, or interact with nearby objects"""
+        if self.ui_manager.dialogue_box.is_active:
+            self._click_channel.play(self.click_sfx)  # Play click sound when skipping/exiting dialogue
+            if self.ui_manager.dialogue_box.is_animating:
+                self.ui_manager.dialogue_box.skip_animation()  # Skip animation
+            else:
+                self.ui_manager.dialogue_box.hide()  # Close dialogue
+        elif not self.paused:
+            self.interact_with_objects()
+    
+    def _handle_escape_key(self):
+        """Close the password UI, or toggle pause"""
+        if self.ui_manager.password_ui.visible:
+            self._click_channel.play(self.click_sfx)
+            self.ui_manager.password_ui.hide()
+        else:
+            self._click_channel.play(self.click_sfx)
+            self.paused = not self.paused
+    
+    def _handle_pause_key(self):
+        """Toggle pause unless the password UI is open"""
+        if not self.ui_manager.password_ui.visible:
+            self._click_channel.play(self.click_sfx)
+            self.paused = not self.paused
+    
+    def _toggle_debug(self):
+        self.show_debug = not self.show_debug
+    
+    def _toggle_smooth_camera(self):
+        self.smooth_camera = not self.smooth_camera
+    
+    def _toggle_coordinates(self):
+        self.ui_manager.hud.show_coordinates = not self.ui_manager.hud.show_coordinates
+    
+    def _toggle_speed_debug(self):
+        self.ui_manager.hud.show_speed_debug = not self.ui_manager.hud.show_speed_debug
+    
+    def _toggle_creation_mode(self):
+        """Toggle creation mode, dropping the selection when leaving it"""
+        self.creation_mode = not self.creation_mode
+        if not self.creation_mode:
+            self.selected_tiles.clear()
+            self.delete_mode = False
+        self.ui_manager.show_message(
+            f"Creation mode: {'ON' if self.creation_mode else 'OFF'} ({self.creation_type})", 2000
+        )
+    
+    def _cycle_creation_type(self):
+        """Switch between note, door and delete creation modes"""
+        if self.creation_type == "note":
+            self.creation_type = "door"
+            self.delete_mode = False
+        elif self.creation_type == "door":
+            self.creation_type = "delete"
+            self.delete_mode = True
+        else:  # delete mode
+            self.creation_type = "note"
+            self.delete_mode = False
+        
+        self.selected_tiles.clear()
+        mode_text = "DELETE" if self.delete_mode else self.creation_type.upper()
+        self.ui_manager.show_message(f"Creation mode: {mode_text}", 2000)
+    
+    def _handle_create_key(self):
+        """Create an interactable from the selected tiles"""
+        if not self.delete_mode:
+            self._create_and_save_interactable()
+        else:
+            self.ui_manager.show_message("Cannot create in delete mode - use TAB to switch modes", 2000)
+    
+    def _load_next_level(self):
+        """Debug: jump to the next level"""
+        if self.level_manager.load_next_level():
+            start_x, start_y = self.level_manager.get_level_starting_point()
+            self.player.set_position(start_x, start_y)
+            self.load_level_interactables()
+    
+    def _load_previous_level(self):
+        """Debug: jump to the previous level"""
+        if self.level_manager.load_previous_level():
+            start_x, start_y = self.level_manager.get_level_starting_point()
+            self.player.set_position(start_x, start_y)
+            self.load_level_interactables()
+    
+    def _restart_level(self):
+        """Debug: reload the current level and reset the player to its start"""
+        current_name = self.level_manager.current_level_name
+        if current_name:
+            if self.level_manager.load_level(current_name):
+                start_x, start_y = self.level_manager.get_level_starting_point()
+                self.player.set_position(start_x, start_y)
+                self.load_level_interactables()
+    
+    def _force_reload_level(self):
+        """Debug: reload the current level from file, keeping the player in place"""
+        current_name = self.level_manager.current_level_name
+        if current_name and self.level_manager.load_level(current_name):
+            self.load_level_interactables()
+    
+    def _clear_rules(self):
+        """Debug: clear collected rules"""
+        game_state.clear_rules_for_testing()
+        self.ui_manager.show_message("Rules cleared for testing!", 2000)
+    
     def handle_resize(self, width: int, height: int):
         """Handle window resize events"""
         # Update screen dimensions
@@ -320,16 +568,17 @@ class GameDemo:
         if not self.is_fullscreen:
             self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
         
-        # Reinitialize UI components that depend on screen size
-        if hasattr(self.ui_manager, 'dialogue_box'):
-            self.ui_manager.dialogue_box._init_dimensions()
+        # Pause overlays are rebuilt for the new display surface
+        self._dim_surface = None
+        self._noise_surface = None
+        self._paused_frame = None
         
-        if hasattr(self.ui_manager, 'password_ui'):
-            self.ui_manager.password_ui._init_dimensions()
+        # Reinitialize UI components that depend on screen size (UIManager always creates them)
+        self.ui_manager.dialogue_box._init_dimensions()
+        self.ui_manager.password_ui._init_dimensions()
         
         # Update camera viewport
-        if hasattr(self.level_manager, 'camera'):
-            self.level_manager.camera.update_viewport(width, height)
+        self.level_manager.camera.update_viewport(width, height)
         
         # Show popup notification
         self.ui_manager.show_popup(f"Window resized to {width}x{height}")
@@ -354,7 +603,7 @@ class GameDemo:
             # Fallback to safe values if there's an error
             self.mouse_tile_x = 0
             self.mouse_tile_y = 0
-            print(f"Error updating mouse coordinates: {e}")
+            self._log_error("mouse_coords", f"Error updating mouse coordinates: {e}")
     
     def _handle_mouse_click(self, pos):
         """Handle mouse click events"""
@@ -395,7 +644,7 @@ class GameDemo:
         else:
             # Try to interact with clicked tile
             try:
-                player_x, player_y = self.player.get_position()
+                player_x, player_y = self._player_pos
 
                 result = interactable_manager.interact_at(
                     self.mouse_tile_x, self.mouse_tile_y, 
@@ -442,8 +691,9 @@ class GameDemo:
                 self.ui_manager.show_message("Failed to create doors!", 2000)
         else:
             # Create note interactables (existing functionality)
+            # The save only reads the selection (grouping works on its own copy), so pass it as is
             success = interactable_manager.save_interactables_to_level_file(
-                self.selected_tiles.copy(), 
+                self.selected_tiles, 
                 tile_id="25"
             )
             
@@ -474,48 +724,34 @@ class GameDemo:
     
     def _find_doors_in_level(self) -> List[Tuple[int, int]]:
         """Find all door positions in the current level"""
-        doors = []
-        for obj in interactable_manager.interactables:
-            if obj.__class__.__name__ == 'Door':
-                doors.append((obj.x, obj.y))
-        return doors
+        return [(door.x, door.y) for door in self._doors]
     
     def _get_nearest_door_position(self) -> Tuple[int, int]:
         """Get the position of the nearest door to the player"""
-        doors = self._find_doors_in_level()
+        doors = self._door_positions
         if not doors:
             return None
         
-        player_x, player_y = self.player.get_position()
-        
-        player_tile_x = int(player_x // 16)
-        player_tile_y = int(player_y // 16)
-        
-        # Find the nearest door
-        nearest_door = None
-        nearest_distance = float('inf')
+        player_tile_x, player_tile_y = self._player_tile
         
-        for door_x, door_y in doors:
-            # Calculate distance to door
-            dx = door_x - player_tile_x
-            dy = door_y - player_tile_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < nearest_distance:
-                nearest_distance = distance
-                nearest_door = (door_x, door_y)
+        # Large door sets are searched in one vectorized pass
+        if len(doors) >= _VECTORIZED_DOOR_SEARCH_MIN:
+            door_xy = self._door_xy
+            d2 = (door_xy[:, 0] - player_tile_x) ** 2 + (door_xy[:, 1] - player_tile_y) ** 2
+            return doors[int(d2.argmin())]
         
-        return nearest_door
+        # Find the nearest door; squared tile distances rank the same as real ones and stay integer
+        return min(
+            doors,
+            key=lambda door: (door[0] - player_tile_x) ** 2 + (door[1] - player_tile_y) ** 2
+        )
     
     def _calculate_direction_to_door(self, door_pos: Tuple[int, int]) -> float:
         """Calculate the angle (in radians) from player to door"""
         if not door_pos:
             return 0
         
-        player_x, player_y = self.player.get_position()
-        
-        player_tile_x = int(player_x // 16)
-        player_tile_y = int(player_y // 16)
+        player_tile_x, player_tile_y = self._player_tile
         
         door_x, door_y = door_pos
         
@@ -532,15 +768,15 @@ class GameDemo:
     def update(self):
         """Update game state"""
         if self.paused or self.ui_manager.password_ui.visible or self.ui_manager.dialogue_box.is_active:
-            self.ui_manager.update(self.clock.get_time() / 1000.0)
+            self.ui_manager.update(self.dt)
             return
         
         # Handle player movement
-        keys = pygame.key.get_pressed()
-        self.player.move(keys, self.level_manager)
+        self.player.move(self._keys, self.level_manager)
+        self._refresh_player_position()
         
         # Update camera to follow player
-        player_x, player_y = self.player.get_position()
+        player_x, player_y = self._player_pos
         self.level_manager.update_camera(
             player_x, player_y,
             smooth=self.smooth_camera
@@ -549,13 +785,71 @@ class GameDemo:
         self.ui_manager.compass.update_position()
         
         # Update UI manager
-        self.ui_manager.update(self.clock.get_time() / 1000.0)
-        
-        # Check for nearby interactables
-        self.check_nearby_interactables()
+        self.ui_manager.update(self.dt)
+        
+        # Check for nearby interactables every few frames, or straight away after a real move
+        self._proximity_frame += 1
+        last_pos = self._last_proximity_pos
+        if (self._proximity_frame % _PROXIMITY_CHECK_INTERVAL == 0 or last_pos is None
+                or abs(player_x - last_pos[0]) + abs(player_y - last_pos[1]) > _PROXIMITY_MOVE_THRESHOLD):
+            self.check_nearby_interactables()
+            self._last_proximity_pos = (player_x, player_y)
     
     def render(self):
         """Render the game"""
+        # While paused the scene under the overlay can't change, so reuse the dimmed
+        # frame captured on the first paused frame instead of redrawing the level
+        paused_frame = self._paused_frame if self.paused else None
+        if paused_frame is not None and paused_frame.get_size() == self.screen.get_size():
+            self.screen.blit(paused_frame, (0, 0))
+        else:
+            self._paused_frame = None
+            self._render_scene()
+            
+            # Draw pause effect before UI so PAUSED text appears on top
+            if self.paused:
+                # Dimming overlay
+                if self._dim_surface is None or self._dim_surface.get_size() != (self.screen_width, self.screen_height):
+                    self._dim_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+                    self._dim_surface.fill((0, 0, 0, 150))  # Semi-transparent black
+                self.screen.blit(self._dim_surface, (0, 0))
+                self._paused_frame = self.screen.copy()
+
+        if self.paused:
+            # Static effect
+            self._draw_static_noise()
+
+        # Refresh the persistent frame data in place rather than building it every frame
+        game_data = self._frame_data
+        nearest_door = self._get_nearest_door_position()
+        game_data.player_speed = self.player.speed
+        game_data.camera_zoom = self.level_manager.camera.zoom
+        game_data.nearest_door = nearest_door
+        game_data.door_angle = self._calculate_direction_to_door(nearest_door)
+        game_data.current_rules = self.current_level_rules
+        game_data.total_rules = (
+            interactable_manager.level_metadata.get("rule_count", 0) 
+            if hasattr(interactable_manager, 'level_metadata') 
+            else len(self.current_level_rules)
+        )
+        game_data.paused = self.paused
+        game_data.player_pos = self._player_pos
+        game_data.mouse_pos = (self.mouse_x, self.mouse_y)
+        game_data.fps = self.clock.get_fps()
+        debug_info = game_data.debug_info
+        debug_info['mouse_tile'] = (self.mouse_tile_x, self.mouse_tile_y)
+        debug_info['creation_mode'] = self.creation_mode
+        debug_info['creation_type'] = self.creation_type
+        debug_info['selected_tiles'] = self.selected_tiles
+
+        # Render UI (including PAUSED text)
+        self.ui_manager.render(game_data)
+
+        # Update display
+        pygame.display.flip()
+    
+    def _render_scene(self):
+        """Draw the level, debug overlays and player"""
         # Fill screen with black background
         self.screen.fill((0, 0, 0))
         
@@ -566,59 +860,49 @@ class GameDemo:
         if self.show_coordinates:
             self._draw_existing_interactables()
 
-        game_data = {
-            'player_speed': self.player.speed,
-            'camera_zoom': self.level_manager.camera.zoom,
-            'nearest_door': self._get_nearest_door_position(),
-            'door_angle': self._calculate_direction_to_door(self._get_nearest_door_position()),
-            'current_rules': self.current_level_rules,
-            'total_rules': (
-                interactable_manager.level_metadata.get("rule_count", 0) 
-                if hasattr(interactable_manager, 'level_metadata') 
-                else len(self.current_level_rules)
-            ),
-            'paused': self.paused,
-            'player_pos': self.player.get_position(),
-            'mouse_pos': (self.mouse_x, self.mouse_y),
-            'fps': self.clock.get_fps(),
-            'debug_info': {
-                'mouse_tile': (self.mouse_tile_x, self.mouse_tile_y),
-                'creation_mode': self.creation_mode,
-                'creation_type': self.creation_type,
-                'selected_tiles': self.selected_tiles
-            }
-        }
-
         if self.creation_mode:
             self._draw_selected_tiles()
 
         # Render player
         self.player.render(self.screen, self.level_manager.camera)
-
-        # Draw pause effect before UI so PAUSED text appears on top
-        if self.paused:
-            # Dimming overlay
-            dim_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            dim_surface.fill((0, 0, 0, 150))  # Semi-transparent black
-            self.screen.blit(dim_surface, (0, 0))
-
-            # Static effect
-            for _ in range(2000): # Draw 2000 static particles
-                x = random.randint(0, self.screen_width)
-                y = random.randint(0, self.screen_height)
-                color = random.choice([(200, 200, 200), (150, 150, 150), (100,100,100)]) # Shades of gray
-                self.screen.set_at((x,y), color)
-
-        # Render UI (including PAUSED text)
-        self.ui_manager.render(game_data)
-
-        # Update display
-        pygame.display.flip()
+    
+    def _draw_static_noise(self, count: int = 2000):
+        """Draw random gray static particles over the screen"""
+        tile_w, tile_h = _NOISE_TILE_SIZE
+        if self._noise_surface is None:
+            # Black pixels are transparent, so only the particles overwrite the screen
+            self._noise_surface = pygame.Surface(_NOISE_TILE_SIZE).convert()
+            self._noise_surface.fill((0, 0, 0))
+            self._noise_surface.set_colorkey((0, 0, 0))
+            self._noise_points = None
+        
+        # Keep the on-screen particle density of `count` particles spread over the whole screen
+        tile_count = max(1, count * tile_w * tile_h // max(1, self.screen_width * self.screen_height))
+        xs = np.random.randint(0, tile_w, tile_count)
+        ys = np.random.randint(0, tile_h, tile_count)
+        shades = np.random.choice(np.array([200, 150, 100], dtype=np.uint8), tile_count) # Shades of gray
+        
+        pixels = pygame.surfarray.pixels3d(self._noise_surface)
+        if self._noise_points is not None:
+            pixels[self._noise_points] = 0  # Clear last frame's particles
+        pixels[xs, ys] = shades[:, None]
+        del pixels  # Unlock the surface before blitting
+        self._noise_points = (xs, ys)
+        
+        # Wrap the tile across the screen
+        tile = self._noise_surface
+        self.screen.blits(
+            [(tile, (x, y))
+             for y in range(0, self.screen_height, tile_h)
+             for x in range(0, self.screen_width, tile_w)],
+            doreturn=False
+        )
     
     def _draw_selected_tiles(self):
         """Draw overlay for selected tiles in creation mode"""
         zoom = self.level_manager.camera.zoom
         camera = self.level_manager.camera
+        tile_size = int(16 * zoom)
         
         for tile_x, tile_y in self.selected_tiles:
             # Convert tile coordinates to screen coordinates
@@ -626,171 +910,59 @@ class GameDemo:
             world_y = tile_y * 16
             screen_x, screen_y = camera.apply(world_x, world_y)
             
-            # Draw selection overlay
-            rect = pygame.Rect(
-                int(screen_x * zoom), 
-                int(screen_y * zoom), 
-                int(16 * zoom), 
-                int(16 * zoom)
-            )
-            pygame.draw.rect(self.screen, (255, 255, 0, 128), rect, 2)  # Yellow border
+            # Draw selection overlay (pygame takes the rect as a plain tuple)
+            pygame.draw.rect(
+                self.screen, (255, 255, 0, 128),
+                (int(screen_x * zoom), int(screen_y * zoom), tile_size, tile_size),
+                2
+            )  # Yellow border
     
-    def _draw_coordinate_debug(self):
-        """Draw coordinate debug information"""
-        try:
-            font = pygame.font.Font(None, 24)
-            small_font = pygame.font.Font(None, 18)
-
-            player_x, player_y = self.player.get_position()
-            
-            # Player coordinates
-            player_tile_x = int(player_x // 16)
-            player_tile_y = int(player_y // 16)
-            
-            debug_info = [
-                f"Player: ({player_tile_x}, {player_tile_y}) | Pixel: ({int(self.player.get_position()[0])}, {int(player_y)})",
-                f"Mouse: ({self.mouse_tile_x}, {self.mouse_tile_y}) | Screen: ({self.mouse_x}, {self.mouse_y})",
-            ]
-            
-            # Get tile ID information at mouse position
-            try:
-                mouse_world_x = self.mouse_tile_x * 16
-                mouse_world_y = self.mouse_tile_y * 16
-                sprites_at_mouse = self.level_manager.get_sprites_at_position(mouse_world_x, mouse_world_y)
-                
-                if sprites_at_mouse:
-                    # Show tile IDs for all sprites at this position (from background to foreground)
-                    tile_ids = []
-                    for sprite in sprites_at_mouse:
-                        if hasattr(sprite, 'tile_data') and 'id' in sprite.tile_data:
-                            tile_id = sprite.tile_data['id']
-                            layer_depth = sprite.layer_depth
-                            tile_ids.append(f"ID:{tile_id}(L{layer_depth})")
-                    
-                    if tile_ids:
-                        debug_info.append(f"Tile IDs: {', '.join(tile_ids)}")
-                    else:
-                        debug_info.append("Tile IDs: No sprites with IDs")
-                else:
-                    debug_info.append("Tile IDs: No sprites at position")
-            except Exception as e:
-                debug_info.append(f"Tile IDs: Error getting sprite info")
-            
-            # Check if mouse is over an interactable (with safety check)
-            try:
-                mouse_interactable = interactable_manager.get_interactable_at(self.mouse_tile_x, self.mouse_tile_y)
-                if mouse_interactable:
-                    if hasattr(mouse_interactable, 'tiles'):
-                        debug_info.append(f"Mouse over: Multi-tile {mouse_interactable.__class__.__name__} ({len(mouse_interactable.tiles)} tiles)")
-                    else:
-                        debug_info.append(f"Mouse over: {mouse_interactable.__class__.__name__}")
-            except Exception as e:
-                debug_info.append(f"Mouse over: Error checking interactable")
-            
-            if self.creation_mode:
-                debug_info.append(f"Selected tiles: {len(self.selected_tiles)}")
-                mode_text = "DELETE" if self.delete_mode else self.creation_type.upper()
-                debug_info.append(f"Creation mode: {mode_text}")
-                if self.selected_tiles and not self.delete_mode:
-                    # Show how many groups the selection would create
-                    try:
-                        if self.creation_type == "door":
-                            debug_info.append(f"Would create {len(self.selected_tiles)} door(s)")
-                        else:
-                            groups = self._group_adjacent_tiles(self.selected_tiles)
-                            debug_info.append(f"Would create {len(groups)} interactable(s)")
-                    except:
-                        debug_info.append(f"Would create interactable(s)")
-                    debug_info.append(f"Selection: {list(self.selected_tiles)[:3]}{'...' if len(self.selected_tiles) > 3 else ''}")
-                elif self.delete_mode:
-                    debug_info.append("Click on interactables to delete them")
-            
-            y_offset = 60  # Start below zoom indicator
-            for text in debug_info:
-                # Render with outline for visibility
-                text_surface = font.render(text, True, (255, 255, 255))
-                outline_surface = font.render(text, True, (0, 0, 0))
-                
-                self.screen.blit(outline_surface, (11, y_offset + 1))
-                self.screen.blit(text_surface, (10, y_offset))
-                y_offset += 25
-            
-            # Add color legend
-            y_offset += 10
-            legend_title = font.render("Interactable Colors:", True, (255, 255, 255))
-            legend_title_outline = font.render("Interactable Colors:", True, (0, 0, 0))
-            self.screen.blit(legend_title_outline, (11, y_offset + 1))
-            self.screen.blit(legend_title, (10, y_offset))
-            y_offset += 25
-            
-            # Color legend entries
-            legend_entries = [
-                ((0, 255, 0), "Green: Notes with rules"),
-                ((150, 150, 150), "Light Gray: Empty interactables"),
-                ((100, 100, 100), "Dark Gray: Collected/claimed"),
-                ((255, 0, 255), "Magenta: Locked doors"),
-                ((0, 255, 255), "Cyan: Open doors"),
-                ((255, 255, 0), "Yellow: Selected tiles / Proximity hint"),
-                ((255, 255, 255), "White corner: Multi-tile group")
-            ]
-            
-            for color, description in legend_entries:
-                # Draw color box
-                color_rect = pygame.Rect(10, y_offset, 12, 12)
-                pygame.draw.rect(self.screen, color, color_rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), color_rect, 1)
-                
-                # Draw description
-                text_surface = small_font.render(description, True, (255, 255, 255))
-                outline_surface = small_font.render(description, True, (0, 0, 0))
-                self.screen.blit(outline_surface, (26, y_offset - 1))
-                self.screen.blit(text_surface, (25, y_offset - 2))
-                y_offset += 18
-                
-        except Exception as e:
-            # Fallback if there's any error in debug display
-            print(f"Error in coordinate debug display: {e}")
+    def _log_error(self, source: str, message: str):
+        """Print an error from a per-frame path, at most once per interval for each source"""
+        now = pygame.time.get_ticks()
+        last = self._error_log_times.get(source)
+        if last is None or now - last >= _ERROR_LOG_INTERVAL_MS:
+            print(message)
+            self._error_log_times[source] = now
     
     def _group_adjacent_tiles(self, tiles: Set[Tuple[int, int]]) -> List[Set[Tuple[int, int]]]:
-        """Group adjacent tiles together (for preview in debug display)"""
+        """Group 4-adjacent tiles together with a union-find (also used for the debug display preview)"""
         if not tiles:
             return []
         
-        remaining_tiles = tiles.copy()
-        groups = []
+        parent = {tile: tile for tile in tiles}
+        rank = dict.fromkeys(tiles, 0)
         
-        while remaining_tiles:
-            # Start a new group with any remaining tile
-            current_group = set()
-            to_process = [remaining_tiles.pop()]
-            
-            while to_process:
-                current_tile = to_process.pop()
-                if current_tile in current_group:
-                    continue
-                
-                current_group.add(current_tile)
-                x, y = current_tile
-                
-                # Check all 4 adjacent positions (not diagonal)
-                adjacent_positions = [
-                    (x - 1, y),  # Left
-                    (x + 1, y),  # Right
-                    (x, y - 1),  # Up
-                    (x, y + 1),  # Down
-                ]
-                
-                for adj_pos in adjacent_positions:
-                    if adj_pos in remaining_tiles:
-                        to_process.append(adj_pos)
-                        remaining_tiles.remove(adj_pos)
-            
-            groups.append(current_group)
+        def find(tile):
+            # Path halving: point every other node on the way at its grandparent
+            while parent[tile] != tile:
+                parent[tile] = parent[parent[tile]]
+                tile = parent[tile]
+            return tile
         
-        return groups
+        # Adjacency is symmetric, so only the right and down neighbours need checking
+        for x, y in tiles:
+            for neighbour in ((x + 1, y), (x, y + 1)):
+                if neighbour not in parent:
+                    continue
+                root_a, root_b = find((x, y)), find(neighbour)
+                if root_a == root_b:
+                    continue
+                # Union by rank keeps the trees shallow
+                if rank[root_a] < rank[root_b]:
+                    root_a, root_b = root_b, root_a
+                parent[root_b] = root_a
+                if rank[root_a] == rank[root_b]:
+                    rank[root_a] += 1
+        
+        groups = defaultdict(set)
+        for tile in tiles:
+            groups[find(tile)].add(tile)
+        return list(groups.values())
     
     def load_level_interactables(self):
         """Load interactables for the current level"""
+        self._paused_frame = None  # The scene under the pause overlay is about to change
         if self.level_manager.current_level:
             # Reset current level rules when loading a new level
             self.current_level_rules = []
@@ -814,19 +986,27 @@ class GameDemo:
             
             print(f"Total rules used across all levels: {len(self.used_rules)}")
             
+            # Doors only change when the level's interactables are reloaded
+            self._doors = [obj for obj in interactable_manager.interactables if isinstance(obj, Door)]
+            self._door_positions = self._find_doors_in_level()
+            self._door_xy = np.array(self._door_positions, dtype=np.int32).reshape(-1, 2)
+            self._build_interactable_grid()
+            
             # Update door requirements based on accumulated rules
             self._update_door_requirements()
             
             # Reset transition flag after loading
             self.is_transitioning = False
     
+    def _refresh_player_position(self):
+        """Cache the player's pixel and tile position; read by everything else for the rest of the frame"""
+        player_x, player_y = self.player.get_position()
+        self._player_pos = (player_x, player_y)
+        self._player_tile = (int(player_x // 16), int(player_y // 16))
+    
     def check_nearby_interactables(self):
         """Check for nearby interactables and show interaction hints"""
-        player_x, player_y = self.player.get_position()
-
-        # Convert player position to tile coordinates
-        player_tile_x = int(player_x // 16)
-        player_tile_y = int(player_y // 16)
+        player_tile_x, player_tile_y = self._player_tile
         
         # Check adjacent tiles for interactables
         adjacent_positions = [
@@ -837,17 +1017,18 @@ class GameDemo:
             (player_tile_x, player_tile_y + 1),  # Down
         ]
         
-        for tile_x, tile_y in adjacent_positions:
-            obj = interactable_manager.get_interactable_at(tile_x, tile_y)
-            if obj:
+        # Look the tiles up in the per-tile index rather than scanning every interactable
+        tile_index = self._tile_index
+        for position in adjacent_positions:
+            if position in tile_index:
                 # Could show interaction prompt here
                 break
     
     def interact_with_objects(self):
         """Interact with nearby objects"""
-        # Convert player position to tile coordinates
-        player_x, player_y = self.player.get_position()
-        player_tile_x, player_tile_y = self.player.get_tile_position()
+        # Player position in pixels and tiles
+        player_x, player_y = self._player_pos
+        player_tile_x, player_tile_y = self._player_tile
         
         # Check adjacent tiles for interactables
         adjacent_positions = [
@@ -872,11 +1053,11 @@ class GameDemo:
         # Play appropriate sound effect based on interaction type and message content
         if interaction_type == "note_collected":
             if ':' in message and "You found a rule:" not in message:  # NPC interaction
-                self.npc_sfx.play()
+                self._npc_channel.play(self.npc_sfx)
             else:  # Regular note/object interaction
-                self.interact_sfx.play()
+                self._interact_channel.play(self.interact_sfx)
         elif interaction_type != "none":  # Other valid interactions
-            self.interact_sfx.play()
+            self._interact_channel.play(self.interact_sfx)
 
         # Handle different types of interactions
         if interaction_type == "note_collected":
@@ -906,21 +1087,23 @@ class GameDemo:
                 self.ui_manager.show_message("There's nothing here.", 2000)
                 
         elif interaction_type == "door_locked":
-            self.click_sfx.play()
+            self._click_channel.play(self.click_sfx)
             self.ui_manager.show_message(message or "Door is locked.", 3000)
                 
         elif interaction_type == "door_password_prompt":
             # Show password UI with preserved password if available
-            self.click_sfx.play()
+            self._click_channel.play(self.click_sfx)
             rules = result.get("rules", [])
             collected_rules = result.get("collected_rules", [])
             door = result.get("door")
             
             # Combine accumulated rules from previous levels with current level collected rules
             combined_collected_rules = self.accumulated_rules.copy()
+            combined_rule_set = set(self._accumulated_rule_set)
             for rule in collected_rules:
-                if rule not in combined_collected_rules:
+                if rule not in combined_rule_set:
                     combined_collected_rules.append(rule)
+                    combined_rule_set.add(rule)
             
             self.ui_manager.show(
                 rules, 
@@ -944,11 +1127,11 @@ class GameDemo:
     
     def handle_password_result(self, result: Dict[str, Any]):
         """Handle password attempt results"""
-        self.click_sfx.play()
+        self._click_channel.play(self.click_sfx)
         print(f"DEBUG: Password result received: {result}")
         
         if result.get("success", False):
-            self.success_sfx.play() 
+            self._success_channel.play(self.success_sfx) 
             print(f"DEBUG: Password was successful!")
             
             # Check if we just completed level-4 - if so, trigger game completion
@@ -977,8 +1160,9 @@ class GameDemo:
                 # Accumulate rules
                 current_level_rules = self.current_level_rules if self.current_level_rules else []
                 for rule in current_level_rules:
-                    if rule != "????" and rule not in self.accumulated_rules:
+                    if rule != "????" and rule not in self._accumulated_rule_set:
                         self.accumulated_rules.append(rule)
+                        self._accumulated_rule_set.add(rule)
                         print(f"Accumulated rule: {rule}")
                 
                 # Extract current level number from level name for display
@@ -999,65 +1183,81 @@ class GameDemo:
                 # For non-transition results (like door_opened), just hide the UI
                 self.ui_manager.password_ui.hide()
         else:
-            self.invalid_sfx.play()
+            self._invalid_channel.play(self.invalid_sfx)
             print(f"DEBUG: Password was not successful")
             # Show error as popup instead of message
             message = result.get("message", "Your password is invalid.")
             self.ui_manager.show_popup(message, 2000)
     
+    def _build_interactable_grid(self):
+        """Bucket interactable tiles into chunks of 16x16 tiles for viewport culling, and index them by tile"""
+        grid = {}
+        tile_index = {}
+        for obj in interactable_manager.interactables:
+            is_multi_tile = obj.is_multi_tile
+            for tile_x, tile_y in obj.tile_positions:
+                grid.setdefault((tile_x >> _GRID_CHUNK_SHIFT, tile_y >> _GRID_CHUNK_SHIFT), []).append(
+                    (obj, tile_x, tile_y, is_multi_tile)
+                )
+                tile_index.setdefault((tile_x, tile_y), []).append(obj)
+        self._interactable_grid = grid
+        self._tile_index = tile_index
+    
     def _draw_existing_interactables(self):
         """Draw outlines around existing interactable tiles (debug only)"""
         zoom = self.level_manager.camera.zoom
         camera = self.level_manager.camera
         
-        for obj in interactable_manager.interactables:
-            if hasattr(obj, 'tiles'):  # Multi-tile interactable
-                # Draw outline around all tiles in the group
-                for tile_x, tile_y in obj.tiles:
-                    world_x = tile_x * 16
-                    world_y = tile_y * 16
-                    screen_x, screen_y = camera.apply(world_x, world_y)
-                    
-                    rect = pygame.Rect(
-                        int(screen_x * zoom), 
-                        int(screen_y * zoom), 
-                        int(16 * zoom), 
-                        int(16 * zoom)
-                    )
-                    
+        # Only visit the chunks the viewport overlaps
+        view_w, view_h = camera.get_effective_screen_size()
+        first_x = int(camera.x // 16) >> _GRID_CHUNK_SHIFT
+        first_y = int(camera.y // 16) >> _GRID_CHUNK_SHIFT
+        last_x = int((camera.x + view_w + 16) // 16) >> _GRID_CHUNK_SHIFT
+        last_y = int((camera.y + view_h + 16) // 16) >> _GRID_CHUNK_SHIFT
+        grid = self._interactable_grid
+        
+        # The camera is fixed for the frame, so resolve its offset (as camera.apply would)
+        # and the zoomed sizes once instead of per tile
+        offset_x = int(camera.x)
+        offset_y = int(camera.y)
+        tile_size = int(16 * zoom)
+        corner_size = max(4, int(4 * zoom))
+        
+        # Each outline is a pre-drawn stamp, so the whole overlay goes out in one blit call
+        outline_blits = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                for obj, tile_x, tile_y, is_multi_tile in grid.get((chunk_x, chunk_y), ()):
                     # Determine color based on interactable type and state
                     color = self._get_interactable_color(obj)
-                    
-                    # Draw thicker outline for multi-tile groups
-                    pygame.draw.rect(self.screen, color, rect, 3)
-                    
-                    # Add a small indicator in the corner for multi-tile groups
-                    corner_size = max(4, int(4 * zoom))
-                    corner_rect = pygame.Rect(
-                        rect.right - corner_size, 
-                        rect.top, 
-                        corner_size, 
-                        corner_size
-                    )
-                    pygame.draw.rect(self.screen, (255, 255, 255), corner_rect)
-                    
-            else:  # Single-tile interactable
-                world_x = obj.x * 16
-                world_y = obj.y * 16
-                screen_x, screen_y = camera.apply(world_x, world_y)
-                
-                rect = pygame.Rect(
-                    int(screen_x * zoom), 
-                    int(screen_y * zoom), 
-                    int(16 * zoom), 
-                    int(16 * zoom)
-                )
-                
-                # Determine color based on interactable type and state
-                color = self._get_interactable_color(obj)
+                    stamp = self._get_outline_stamp(color, is_multi_tile, tile_size, corner_size)
+                    outline_blits.append((
+                        stamp,
+                        (int((tile_x * 16 - offset_x) * zoom), int((tile_y * 16 - offset_y) * zoom))
+                    ))
+        
+        fast_blits(self.screen, outline_blits)
+    
+    def _get_outline_stamp(self, color: tuple, is_multi_tile: bool, tile_size: int, corner_size: int) -> pygame.Surface:
+        """Get a tile outline drawn onto a transparent surface, drawing it on first use"""
+        key = (color, is_multi_tile, tile_size, corner_size)
+        stamp = self._outline_stamps.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+            rect = stamp.get_rect()
+            if is_multi_tile:
+                # Draw thicker outline for multi-tile groups
+                pygame.draw.rect(stamp, color, rect, 3)
                 
+                # Add a small indicator in the corner for multi-tile groups
+                pygame.draw.rect(stamp, (255, 255, 255), (rect.right - corner_size, rect.top, corner_size, corner_size))
+            else:
                 # Draw outline
-                pygame.draw.rect(self.screen, color, rect, 2)
+                pygame.draw.rect(stamp, color, rect, 2)
+            if len(self._outline_stamps) >= 64:
+                self._outline_stamps.pop(next(iter(self._outline_stamps)))  # Drop the oldest entry
+            self._outline_stamps[key] = stamp
+        return stamp
     
     def _get_interactable_color(self, obj) -> tuple:
         """Get the appropriate color for an interactable based on its type and state"""
@@ -1070,18 +1270,7 @@ class GameDemo:
             return (0, 255, 255)  # Cyan for open doors
         
         # Check object type
-        if obj.__class__.__name__ == 'Door':
-            return (255, 0, 255)  # Magenta for locked doors
-        elif obj.__class__.__name__ == 'EmptyInteractable':
-            return (150, 150, 150)  # Light gray for empty interactables
-        elif obj.__class__.__name__ == 'MultiTileEmptyInteractable':
-            return (150, 150, 150)  # Light gray for multi-tile empty interactables
-        elif obj.__class__.__name__ == 'Note':
-            return (0, 255, 0)  # Green for notes with rules
-        elif obj.__class__.__name__ == 'MultiTileNote':
-            return (0, 255, 0)  # Green for multi-tile notes with rules
-        else:
-            return (255, 255, 0)  # Yellow for unknown/other types
+        return _INTERACTABLE_COLORS.get(type(obj), _DEFAULT_INTERACTABLE_COLOR)
     
     def _show_interactables_info(self):
         """Show information about programmatic interactables for the current level"""
@@ -1160,10 +1349,33 @@ class GameDemo:
         else:
             self.ui_manager.show_message("Failed to clean up duplicates!", 2000)
     
-    def transition_to_level(self, level_name: str):
-        """Transition to a new level"""
+    def transition_to_level(self, level_name: str) -> bool:
+        """
+        Start a transition to a new level; the level file is read in the background
+
+        Returns True when the load was scheduled, not when the level is in place: the
+        switch happens in _finish_level_transition on a later frame, which keeps the
+        current level if the load fails.
+        """
+        if self._pending_level is not None:
+            return False  # A transition is already under way
+        
+        # Parsing the level JSON is the slow part; the previous level keeps rendering meanwhile
+        future = self._io_executor.submit(self.level_manager.loader.load_level, level_name)
+        self._pending_level = (level_name, self.level_manager.current_level_name, future)
+        return True
+    
+    def _finish_level_transition(self):
+        """Switch to the pending level once its data has loaded in the background"""
+        level_name, previous_name, future = self._pending_level
+        if not future.done():
+            return
+        self._pending_level = None
+        self._paused_frame = None  # The scene under the pause overlay is about to change
+        
         try:
-            if self.level_manager.load_level(level_name):
+            # The parsed level is cached by the loader, so this only builds sprites
+            if future.result() and self.level_manager.load_level(level_name):
                 # Reset player position to the new level's starting point
                 start_x, start_y = self.level_manager.get_level_starting_point()
                 self.player.set_position(start_x, start_y)
@@ -1171,10 +1383,17 @@ class GameDemo:
                 # Set transition flag and load interactables
                 self.is_transitioning = True
                 self.load_level_interactables()
-                return True
+                return
+            print(f"Error transitioning to level {level_name}: level could not be loaded")
         except Exception as e:
             print(f"Error transitioning to level {level_name}: {e}")
-        return False
+        
+        # The transition failed; stay on (or go back to) the previous level
+        self.is_transitioning = False
+        if previous_name and self.level_manager.current_level_name != previous_name:
+            if self.level_manager.load_level(previous_name):
+                self.load_level_interactables()
+        self.ui_manager.show_popup(f"Could not load {level_name}", 3000)
     
     def _update_door_requirements(self):
         """Update door required rules based on accumulated rules plus current level rules"""
@@ -1190,10 +1409,9 @@ class GameDemo:
         total_required_rules = len(self.accumulated_rules) + current_level_rule_count
         
         # Update all doors in the current level
-        for obj in interactable_manager.interactables:
-            if obj.__class__.__name__ == 'Door':
-                obj.set_required_rules(total_required_rules)
-                print(f"Updated door at ({obj.x}, {obj.y}) to require {total_required_rules} rules")
+        for door in self._doors:
+            door.set_required_rules(total_required_rules)
+            print(f"Updated door at ({door.x}, {door.y}) to require {total_required_rules} rules")
         
         print(f"Door requirements updated: {len(self.accumulated_rules)} accumulated + {current_level_rule_count} current = {total_required_rules} total")
     
@@ -1202,37 +1420,18 @@ class GameDemo:
         zoom = self.level_manager.camera.zoom
         camera = self.level_manager.camera
 
-        player_x, player_y = self.player.get_position()
-        
-        # Convert player position to tile coordinates for proper comparison
-        player_tile_x = int(player_x // 16)
-        player_tile_y = int(player_y // 16)
-        
-        # Collect all nearby interactables (both single and multi-tile)
-        nearby_interactables = []
-        
-        for obj in interactable_manager.interactables:
-            # Check if player is adjacent to this interactable
-            is_player_nearby = False
-            
-            if hasattr(obj, 'tiles'):  # Multi-tile interactable
-                # Check if any tile in the group is adjacent to player
-                for tile_x, tile_y in obj.tiles:
-                    dx = abs(tile_x - player_tile_x)
-                    dy = abs(tile_y - player_tile_y)
-                    # Adjacent means 1 tile away (including diagonals)
-                    if dx <= 1 and dy <= 1:
-                        is_player_nearby = True
-                        break
-            else:  # Single-tile interactable
-                dx = abs(obj.x - player_tile_x)
-                dy = abs(obj.y - player_tile_y)
-                # Adjacent means 1 tile away (including diagonals)
-                if dx <= 1 and dy <= 1:
-                    is_player_nearby = True
-            
-            if is_player_nearby:
-                nearby_interactables.append(obj)
+        # Player tile coordinates for proper comparison
+        player_tile_x, player_tile_y = self._player_tile
+        
+        # Collect all nearby interactables (both single and multi-tile): anything with a tile
+        # within 1 tile of the player, including diagonals
+        tile_index = self._tile_index
+        nearby = {}  # Insertion-ordered set
+        for tile_y in range(player_tile_y - 1, player_tile_y + 2):
+            for tile_x in range(player_tile_x - 1, player_tile_x + 2):
+                for obj in tile_index.get((tile_x, tile_y), ()):
+                    nearby[obj] = None
+        nearby_interactables = list(nearby)
         
         # Group all adjacent interactables and their tiles
         grouped_tiles = self._group_all_adjacent_interactables(nearby_interactables)
@@ -1251,45 +1450,10 @@ class GameDemo:
         # Collect all tiles from all interactables
         all_tiles = set()
         for obj in nearby_interactables:
-            if hasattr(obj, 'tiles'):  # Multi-tile interactable
-                for tile_x, tile_y in obj.tiles:
-                    all_tiles.add((tile_x, tile_y))
-            else:  # Single-tile interactable
-                all_tiles.add((obj.x, obj.y))
+            all_tiles.update(obj.tile_positions)
         
         # Group adjacent tiles together
-        grouped_tiles = []
-        remaining_tiles = all_tiles.copy()
-        
-        while remaining_tiles:
-            # Start a new group with any remaining tile
-            current_group = set()
-            to_process = [remaining_tiles.pop()]
-            
-            while to_process:
-                current_tile = to_process.pop()
-                if current_tile in current_group:
-                    continue
-                
-                current_group.add(current_tile)
-                x, y = current_tile
-                
-                # Check all 4 adjacent positions (not diagonal)
-                adjacent_positions = [
-                    (x - 1, y),  # Left
-                    (x + 1, y),  # Right
-                    (x, y - 1),  # Up
-                    (x, y + 1),  # Down
-                ]
-                
-                for adj_pos in adjacent_positions:
-                    if adj_pos in remaining_tiles:
-                        to_process.append(adj_pos)
-                        remaining_tiles.remove(adj_pos)
-            
-            grouped_tiles.append(current_group)
-        
-        return grouped_tiles
+        return self._group_adjacent_tiles(all_tiles)
     
     def _determine_group_color_for_all(self, tile_group, nearby_interactables):
         """Determine the appropriate color for a group of tiles (including single-tile interactables)"""
@@ -1298,14 +1462,7 @@ class GameDemo:
         
         for obj in nearby_interactables:
             # Check if this object's tiles are in the current group
-            obj_tiles_in_group = False
-            
-            if hasattr(obj, 'tiles'):  # Multi-tile interactable
-                obj_tiles_in_group = any((tile_x, tile_y) in tile_group for tile_x, tile_y in obj.tiles)
-            else:  # Single-tile interactable
-                obj_tiles_in_group = (obj.x, obj.y) in tile_group
-            
-            if obj_tiles_in_group:
+            if not tile_group.isdisjoint(obj.tile_positions):
                 if (hasattr(obj, 'collected') and obj.collected) or (hasattr(obj, 'is_open') and obj.is_open):
                     has_collected_or_used = True
                     break  # Found a collected/used item, no need to check further
@@ -1321,57 +1478,105 @@ class GameDemo:
         if not tiles:
             return
         
-        border_thickness = 2
-        tile_size = int(16 * zoom)
-        
-        # For each tile, draw a filled background and only external borders
-        for tile_x, tile_y in tiles:
-            world_x = tile_x * 16
-            world_y = tile_y * 16
-            screen_x, screen_y = camera.apply(world_x, world_y)
-            
-            tile_rect = pygame.Rect(
-                int(screen_x * zoom), 
-                int(screen_y * zoom), 
-                tile_size, 
-                tile_size
-            )
-            
-            # Create a surface for this tile with alpha support
-            tile_surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-            
-            # Fill with a semi-transparent background color
-            background_color = (*border_color[:3], 40)  # Much more transparent background
-            tile_surface.fill(background_color)
-            
-            # Check which edges should have borders (only if adjacent tile is not in the group)
-            
-            # Top edge
-            if (tile_x, tile_y - 1) not in tiles:
-                pygame.draw.rect(tile_surface, border_color, 
-                               (0, 0, tile_size, border_thickness))
-            
-            # Bottom edge
-            if (tile_x, tile_y + 1) not in tiles:
-                pygame.draw.rect(tile_surface, border_color, 
-                               (0, tile_size - border_thickness, tile_size, border_thickness))
-            
-            # Left edge
-            if (tile_x - 1, tile_y) not in tiles:
-                pygame.draw.rect(tile_surface, border_color, 
-                               (0, 0, border_thickness, tile_size))
-            
-            # Right edge
-            if (tile_x + 1, tile_y) not in tiles:
-                pygame.draw.rect(tile_surface, border_color, 
-                               (tile_size - border_thickness, 0, border_thickness, tile_size))
+        offset_x = int(camera.x)
+        offset_y = int(camera.y)
+        screen_width, screen_height = self.screen.get_size()
+        scaled_tile = 16 * zoom
+        
+        highlight_blits = []
+        for rect, edges in self._get_highlight_layout(tiles):
+            # Same mapping as camera.apply; rectangles entirely off screen are skipped
+            dest_x = int((rect.left * 16 - offset_x) * zoom)
+            dest_y = int((rect.top * 16 - offset_y) * zoom)
+            width = round(rect.width * scaled_tile)
+            height = round(rect.height * scaled_tile)
+            if not (-width < dest_x < screen_width and -height < dest_y < screen_height):
+                continue
             
-            # Blit the tile surface to screen
-            self.screen.blit(tile_surface, tile_rect)
+            highlight_surface = self._get_highlight_surface(rect.size, zoom, border_color, edges)
+            highlight_blits.append((highlight_surface, (dest_x, dest_y)))
+        
+        # The whole group goes out in one blit call
+        fast_blits(self.screen, highlight_blits)
+    
+    def _get_highlight_layout(self, tiles: set) -> list:
+        """Get the (rect, edges) pairs that draw a tile group, computing them only for new groups"""
+        key = frozenset(tiles)
+        layout = self._highlight_layouts.get(key)
+        if layout is not None:
+            return layout
+        
+        # The group is drawn as a few rectangles rather than tile by tile. Borders only go on
+        # edges facing outside the group; each side of a rectangle records which of its tiles
+        # have such an edge as a bitmask, first tile in bit 0
+        layout = []
+        for rect in _tiles_to_rects(tiles):
+            left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+            top_edges = bottom_edges = left_edges = right_edges = 0
+            for i, tile_x in enumerate(range(left, right)):
+                top_edges |= ((tile_x, top - 1) not in tiles) << i
+                bottom_edges |= ((tile_x, bottom) not in tiles) << i
+            for i, tile_y in enumerate(range(top, bottom)):
+                left_edges |= ((left - 1, tile_y) not in tiles) << i
+                right_edges |= ((right, tile_y) not in tiles) << i
+            layout.append((rect, (top_edges, bottom_edges, left_edges, right_edges)))
+        
+        if len(self._highlight_layouts) >= 16:
+            self._highlight_layouts.pop(next(iter(self._highlight_layouts)))  # Drop the oldest entry
+        self._highlight_layouts[key] = layout
+        return layout
+    
+    def _get_highlight_surface(self, size: tuple, zoom: float, border_color: tuple, edges: tuple) -> pygame.Surface:
+        """Get a highlight for a rectangle of tiles, with borders along the tile edges set in the
+        (top, bottom, left, right) bitmasks of edges"""
+        key = (size, zoom, border_color, edges)
+        highlight_surface = self._highlight_cache.get(key)
+        if highlight_surface is not None:
+            return highlight_surface
+        
+        border_thickness = 2
+        cols, rows = size
+        # Tile edges inside the rectangle are rounded to the nearest pixel, so at fractional zooms
+        # the tiles share the spare pixels evenly instead of each being cut to int(16 * zoom)
+        scaled_tile = 16 * zoom
+        width = round(cols * scaled_tile)
+        height = round(rows * scaled_tile)
+        
+        # Create a surface for this rectangle with alpha support
+        highlight_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Fill with a semi-transparent background color
+        highlight_surface.fill((*border_color[:3], 40))  # Much more transparent background
+        
+        # Only external borders, i.e. tile edges whose adjacent tile is not in the group
+        top_edges, bottom_edges, left_edges, right_edges = edges
+        for i in range(cols):
+            x = round(i * scaled_tile)
+            segment = round((i + 1) * scaled_tile) - x
+            if top_edges >> i & 1:
+                pygame.draw.rect(highlight_surface, border_color,
+                               (x, 0, segment, border_thickness))
+            if bottom_edges >> i & 1:
+                pygame.draw.rect(highlight_surface, border_color,
+                               (x, height - border_thickness, segment, border_thickness))
+        for i in range(rows):
+            y = round(i * scaled_tile)
+            segment = round((i + 1) * scaled_tile) - y
+            if left_edges >> i & 1:
+                pygame.draw.rect(highlight_surface, border_color,
+                               (0, y, border_thickness, segment))
+            if right_edges >> i & 1:
+                pygame.draw.rect(highlight_surface, border_color,
+                               (width - border_thickness, y, border_thickness, segment))
+        
+        if len(self._highlight_cache) >= 64:
+            self._highlight_cache.pop(next(iter(self._highlight_cache)))  # Drop the oldest entry
+        self._highlight_cache[key] = highlight_surface
+        return highlight_surface
     
     def handle_password_ui_close(self, password: str):
         """Handle password UI being closed via X button - save the current password"""
-        self.click_sfx.play()
+        self._click_channel.play(self.click_sfx)
         if password:
             self.last_successful_password = password
             print(f"Password saved when closing UI: {password}")
@@ -1379,28 +1584,61 @@ class GameDemo:
     def run(self):
         """Main game loop"""
         running = True
+        pygame.event.set_blocked(_UNUSED_EVENT_TYPES)
+        
+        # Game logic runs in fixed steps; rendering and event polling run once per frame
+        self.dt = _UPDATE_STEP_MS * 0.001
+        accumulator = _UPDATE_STEP_MS  # Start with one step due so the first frame is updated
+        caption_countdown = 0
         
         while running:
             # Handle events
             running = self.handle_events()
             
-            # Update game state
-            self.update()
+            # Switch levels once a background load has finished
+            if self._pending_level is not None:
+                self._finish_level_transition()
+            
+            # Pick up any teleport from debug keys or a finished level load
+            self._refresh_player_position()
+            
+            # Held-key state, read once per frame and shared by every update step
+            self._keys = pygame.key.get_pressed()
+            
+            # Update game state once for every step the elapsed time covers
+            while accumulator >= _UPDATE_STEP_MS:
+                self.update()
+                accumulator -= _UPDATE_STEP_MS
             
             # Render
             self.render()
             
-            # Control frame rate
-            self.clock.tick(self.fps)
+            # Control frame rate. tick() counts whole milliseconds, so a steady 60 FPS arrives as
+            # 16 or 17 ms; snap those to exactly one step so every frame runs one update instead of
+            # the odd frame running none (a repeated frame) and another running two
+            elapsed = self.clock.tick(self.fps)
+            if abs(elapsed - _UPDATE_STEP_MS) < 1:
+                elapsed = _UPDATE_STEP_MS
             
-            # Update window title with FPS
-            fps = self.clock.get_fps()
-            level_info = self.level_manager.get_level_info()
-            pygame.display.set_caption(
-                f"Layered Tileset Demo - FPS: {fps:.1f} - "
-                f"Level: {level_info.get('name', 'None')} - "
-                f"Sprites: {level_info.get('visible_sprites', 0)}/{level_info.get('total_sprites', 0)}"
-            )
+            # After a long stall, drop the backlog instead of catching up all at once
+            accumulator = min(accumulator + elapsed, _UPDATE_STEP_MS * _MAX_UPDATES_PER_FRAME)
+            
+            # Update window title with FPS a few times a second
+            caption_countdown -= 1
+            if caption_countdown <= 0:
+                caption_countdown = _CAPTION_UPDATE_INTERVAL
+                fps = self.clock.get_fps()
+                level_info = self.level_manager.get_level_info()
+                pygame.display.set_caption(
+                    f"Layered Tileset Demo - FPS: {fps:.1f} - "
+                    f"Level: {level_info.get('name', 'None')} - "
+                    f"Sprites: {level_info.get('visible_sprites', 0)}/{level_info.get('total_sprites', 0)}"
+                )
+        
+        self._io_executor.shutdown(wait=False)
+        
+        # Menus may still want the event types the game ignores
+        pygame.event.set_allowed(_UNUSED_EVENT_TYPES)
         
         # Don't call pygame.quit() or sys.exit() - let control return to main.py
         print("DEBUG: GameDemo.run() exiting normally, returning control to main.py")
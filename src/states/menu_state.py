@@ -15,6 +15,7 @@ from pygame.locals import DOUBLEBUF, OPENGL
 from constants import *
 from states.menu_substates.ui.crt_filter import CRTFilter
 from states.menu_substates.ui.terminal import Terminal
+from states.menu_substates.ui.font_cache import get_font
 from states.menu_substates.loading_menu_state import LoadingMenuState
 from states.menu_substates.menu_options_state import MenuOptionsState
 from states.menu_substates.how_to_play_state import HowToPlayState
@@ -25,7 +26,7 @@ from states.prelude_state import PreludeState
 class Menu:
     def __init__(self, surface):
         self.screen = surface
-        self.terminal = Terminal(pygame.font.Font(FONT_PATH, TERMINAL_FONT_SIZE))
+        self.terminal = Terminal(get_font(FONT_PATH, TERMINAL_FONT_SIZE))
         
         self.menu_key_sfx = pygame.mixer.Sound('assets/audio/menu_key.wav')
         self.menu_key_sfx.set_volume(0.3)
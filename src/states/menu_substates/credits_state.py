@@ -19,6 +19,7 @@ class CreditsState(BaseMenuState):
     def __init__(self, screen, terminal):
         super().__init__(screen, terminal)
         self.credits_lines = []
+        self.pages = []  # credits_lines split into pages, sliced once when the credits load
         self.current_page = 0
         self.lines_per_page = 15
         self.load_credits()
@@ -34,21 +35,25 @@ class CreditsState(BaseMenuState):
                 self.credits_lines = [line.strip() for line in f.readlines()]
         except FileNotFoundError:
             self.credits_lines = ["Credits file not found"]
+        
+        # An empty file still shows one (empty) page
+        self.pages = [
+            self.credits_lines[i:i + self.lines_per_page]
+            for i in range(0, len(self.credits_lines), self.lines_per_page)
+        ] or [[]]
             
     def get_total_pages(self):
         """Calculate total number of pages"""
-        return max(1, (len(self.credits_lines) + self.lines_per_page - 1) // self.lines_per_page)
+        return len(self.pages)
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return STATE_MENU
             elif event.key in (pygame.K_a, pygame.K_LEFT):
-                self.current_page = max(0, self.current_page - 1)
-                self.update_display()
+                self.change_page(self.current_page - 1)
             elif event.key in (pygame.K_d, pygame.K_RIGHT):
-                self.current_page = min(self.get_total_pages() - 1, self.current_page + 1)
-                self.update_display()
+                self.change_page(self.current_page + 1)
         return None
     
     def enter(self):
@@ -56,16 +61,19 @@ class CreditsState(BaseMenuState):
         self.current_page = 0
         self.update_display()
         
+    def change_page(self, page):
+        """Show the given page, clamped to the valid range; the terminal is only rebuilt if the page changes"""
+        page = max(0, min(self.get_total_pages() - 1, page))
+        if page != self.current_page:
+            self.current_page = page
+            self.update_display()
+        
     def update_display(self):
         """Update terminal display for current page"""
         self.terminal.clear()
-         
-        # Calculate page content
-        start_idx = self.current_page * self.lines_per_page
-        end_idx = min(start_idx + self.lines_per_page, len(self.credits_lines))
         
         # Display current page content
-        for line in self.credits_lines[start_idx:end_idx]:
+        for line in self.pages[self.current_page]:
             self.terminal.add_line(line)
 
         # Display page navigation info
@@ -11,6 +11,7 @@ if pythonpath and pythonpath not in sys.path:
     sys.path.insert(0, pythonpath)
 
 from .base_menu_state import BaseMenuState
+from .ui.font_cache import get_font
 from constants import *
 import pygame
 
@@ -21,7 +22,7 @@ class MenuOptionsState(BaseMenuState):
         self.transitioning = False
         self.transition_start = 0
         self.transition_delay = 5000  # 5 seconds in milliseconds
-        self.title_font = pygame.font.Font(FONT_PATH, MENU_FONT_SIZE) # Create font for title
+        self.title_font = get_font(FONT_PATH, MENU_FONT_SIZE) # Create font for title
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -0,0 +1,21 @@
+import pygame
+
+# Loaded fonts keyed by (path, size), shared by everything that asks for the same face
+_FONTS: dict[tuple, pygame.font.Font] = {}
+
+def get_font(path: str, size: int) -> pygame.font.Font:
+    """
+    Get a font, loading it from disk only the first time a (path, size) pair is requested
+    
+    The returned font is shared, so callers must not change its style (bold, italic, ...).
+    
+    Args:
+        path: Font file path
+        size: Font size
+    """
+    key = (path, size)
+    font = _FONTS.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _FONTS[key] = font
+    return font
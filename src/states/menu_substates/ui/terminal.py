@@ -12,6 +12,7 @@ if pythonpath and pythonpath not in sys.path:
 
 from constants import *
 import pygame
+from states.game.utils.fast_blits import fast_blits
 
 class Terminal:
     def __init__(self, font):
@@ -26,6 +27,10 @@ class Terminal:
         self.animation_speed = 0.2  # Adjust this to control animation speed (0-1)
         self.default_color = TERMINAL_GREEN
         
+        # Rendered text surfaces keyed by (font, text, color); lines only change when the dots animate
+        self._render_cache = {}
+        self._render_cache_size = 128
+        
     def add_line(self, text, animate_dots=False, color=TERMINAL_GREEN, font=None, center=False):
         """Add a new line to the terminal with position tracking, color, custom font, and centering"""
         # Shift existing lines' target positions up
@@ -33,13 +38,17 @@ class Terminal:
             self.target_y_positions[i] = i * self.line_height
             
         # Add new line at the bottom
-        self.lines.append({
+        line = {
             "text": text,
             "animate_dots": animate_dots,
             "color": color,
             "font": font if font else self.font, # Use custom font or default
             "center": center # Store centering preference
-        })
+        }
+        if isinstance(color, dict):
+            # Split colored lines into rendered segments now rather than on every frame
+            line["layout"] = self._layout_colored_text(text, color, line["font"], self.default_color)
+        self.lines.append(line)
         
         bottom_position = len(self.lines) * self.line_height
         self.target_y_positions.append(bottom_position)
@@ -59,8 +68,63 @@ class Terminal:
             if current != target:
                 self.current_y_positions[i] += (target - current) * self.animation_speed
     
+    def _render_text(self, font, text, color):
+        """Render text, reusing the surface from an earlier frame when possible"""
+        key = (font, text, tuple(color))
+        text_surface = self._render_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color)
+            if len(self._render_cache) >= self._render_cache_size:
+                self._render_cache.pop(next(iter(self._render_cache)))  # Drop the oldest entry
+            self._render_cache[key] = text_surface
+        return text_surface
+    
+    def _layout_colored_text(self, text, colors, font, default_color):
+        """
+        Split a line into colored segments
+        
+        Each key of colors is found in order in the text and drawn in its color; the text
+        around the keys uses default_color.
+        
+        Returns:
+            (text, [(surface, x offset from the line start)], width to center the line by)
+        """
+        segments = []
+        x_offset = 0
+        current_pos_in_text = 0
+        for segment_text, segment_color in colors.items():
+            start_idx = text.find(segment_text, current_pos_in_text)
+            if start_idx != -1:
+                # Text before this segment uses default_color
+                if start_idx > current_pos_in_text:
+                    before_surface = self._render_text(font, text[current_pos_in_text:start_idx], default_color)
+                    segments.append((before_surface, x_offset))
+                    x_offset += before_surface.get_width()
+                
+                # Colored segment
+                segment_surface = self._render_text(font, segment_text, segment_color)
+                segments.append((segment_surface, x_offset))
+                x_offset += segment_surface.get_width()
+                current_pos_in_text = start_idx + len(segment_text)
+        
+        # A centered line is centered by the combined width of its colored keys; if none of
+        # them matched, the whole text is one default-color segment centered by its own width
+        rendered_segments = bool(segments)
+        center_width = sum(self._render_text(font, segment_text, default_color).get_width() for segment_text in colors)
+        
+        # Any remaining text (or the full text if no segments matched) uses default_color
+        if current_pos_in_text < len(text):
+            remaining_surface = self._render_text(font, text[current_pos_in_text:], default_color)
+            segments.append((remaining_surface, x_offset))
+            if not rendered_segments:
+                center_width = remaining_surface.get_width()
+        
+        return text, segments, center_width
+    
     def render(self, surface, base_pos):
         """Render all lines with newest at bottom"""
+        # Every line segment goes out in one blit call at the end
+        line_blits = []
         for i, line in enumerate(self.lines):
             text = line["text"]
             if line["animate_dots"]:
@@ -73,76 +137,34 @@ class Terminal:
             if isinstance(line.get("color"), dict):
                 default_color = line.get("default_color", self.default_color)
                 
-                # Calculate total width for centering if needed
-                total_width = 0
-                if center_line:
-                    temp_x = 0
-                    for segment_text, _ in line["color"].items():
-                        # Account for text before and after specific colored segments
-                        # This part might need refinement if default_color text is substantial
-                        # For now, assumes colored segments dominate for centering calculations
-                        # A more robust way would pre-calculate width of the entire formatted line
-                        s_surface = current_font.render(segment_text, True, default_color) # Use default for width calc
-                        total_width += s_surface.get_width()
-                    # A simpler way if we assume the `text` field is the full string:
-                    if not line["color"].items(): # handles case where line might be all default color
-                         total_width = current_font.render(text, True, default_color).get_width()
-                    else: # if there are colored segments, sum their widths
-                        # this is a simplification. For perfect centering of mixed color lines,
-                        # render the whole line to a temp surface first to get its true width.
-                        # For now, we'll sum widths of explicitly colored parts if they exist
-                        # or use the full text if no specific color dict is provided (implies all default color)
-                        pass # total_width is already calculated based on colored segments
-
+                # Segments are laid out once per distinct text (only the animated dots change it)
+                layout = line.get("layout")
+                if layout is None or layout[0] != text:
+                    layout = self._layout_colored_text(text, line["color"], current_font, default_color)
+                    line["layout"] = layout
+                _, segments, center_width = layout
+                
                 x_pos_start = base_pos[0]
                 if center_line:
-                    x_pos_start = (surface.get_width() - total_width) // 2
-
-                x_pos = x_pos_start
+                    x_pos_start = (surface.get_width() - center_width) // 2
                 y_pos = base_pos[1] - ((len(self.lines) - 1 - i) * self.line_height)
-
-                # Split text and render each segment
-                current_pos_in_text = 0
-                rendered_segments = False
-                for segment_text, segment_color in line["color"].items():
-                    start_idx = text.find(segment_text, current_pos_in_text)
-                    if start_idx != -1:
-                        # Render text before this segment with default_color
-                        if start_idx > current_pos_in_text:
-                            before_text = text[current_pos_in_text:start_idx]
-                            before_surface = current_font.render(before_text, True, default_color)
-                            surface.blit(before_surface, (x_pos, y_pos))
-                            x_pos += before_surface.get_width()
-                        
-                        # Render colored segment
-                        segment_surface = current_font.render(segment_text, True, segment_color)
-                        surface.blit(segment_surface, (x_pos, y_pos))
-                        x_pos += segment_surface.get_width()
-                        current_pos_in_text = start_idx + len(segment_text)
-                        rendered_segments = True
                 
-                # Render any remaining text (or full text if no segments matched) with default_color
-                if current_pos_in_text < len(text):
-                    remaining_text = text[current_pos_in_text:]
-                    remaining_surface = current_font.render(remaining_text, True, default_color)
-                    # If centering and no specific segments were rendered, this is the main text to center
-                    if center_line and not rendered_segments:
-                        x_pos = (surface.get_width() - remaining_surface.get_width()) // 2
-                    elif not rendered_segments: # Not centering, and no specific segments rendered
-                         x_pos = x_pos_start # Reset to original starting x_pos for this line
-
-                    surface.blit(remaining_surface, (x_pos, y_pos))
+                for segment_surface, x_offset in segments:
+                    line_blits.append((segment_surface, (x_pos_start + x_offset, y_pos)))
             else:
                 # Original single-color rendering
-                text_surface = current_font.render(text, True, line.get("color", self.default_color))
+                text_surface = self._render_text(current_font, text, line.get("color", self.default_color))
                 y_pos = base_pos[1] - ((len(self.lines) - 1 - i) * self.line_height)
                 x_pos_current = base_pos[0]
                 if center_line:
                     x_pos_current = (surface.get_width() - text_surface.get_width()) // 2
-                surface.blit(text_surface, (x_pos_current, y_pos))
+                line_blits.append((text_surface, (x_pos_current, y_pos)))
+        
+        fast_blits(surface, line_blits)
     
     def clear(self):
         """Clear all lines from the terminal"""
         self.lines = []
         self.target_y_positions = []
-        self.current_y_positions = []
\ No newline at end of file
+        self.current_y_positions = []
+        self._render_cache.clear()
\ No newline at end of file